@@ -6,8 +6,6 @@ Licensed under the Open Software License version 3.0, a copy of which can be
 found in the LICENSE file.
 """
 
-from typing import cast
-
 
 def fmt_exception_group(
     exc_group: ExceptionGroup | BaseExceptionGroup,
@@ -15,7 +13,7 @@ def fmt_exception_group(
     indent="    ",
 ) -> str:
     """Produce an ExceptionGroup summary string with Exception per line,
-    recursing over inner ExceptionGroup exceptions.
+    descending into inner ExceptionGroup exceptions.
 
     Sample output given header="Exiting with exceptions:" and one inner
     ExceptionGroup exception:
@@ -31,29 +29,28 @@ def fmt_exception_group(
     """
 
     def fmt_notes(*args: BaseException):
-        notes: list[str] = [
-            note for exc in args for note in getattr(exc, "__notes__", [])
-        ]
+        notes = [note for exc in args for note in getattr(exc, "__notes__", ())]
         return "(" + ") (".join(notes) + ")" if notes else ""
 
-    def fmt(group: ExceptionGroup | BaseExceptionGroup, level: int, result: list[str]):
-        for exc in cast(tuple[BaseException], group.exceptions):
-            prefix = indent * level
-            if level:
-                prefix += "└> "
-            notes = fmt_notes(group, exc)
-            msg = f"{prefix}{type(exc).__name__}: {exc} {notes}"
-            result.append(msg)
-            if isinstance(exc, (ExceptionGroup, BaseExceptionGroup)):
-                msg += ":"
-                fmt(exc, level + 1, result)
-        return result
-
-    result = fmt(exc_group, 0, [])
-    if header and result:
-        if len(result) > 1:
-            result.insert(0, header)
-        else:
-            result[0] = header + " " + result[0]
+    # Iterative depth-first traversal. The stack holds (exception, parent group,
+    # nesting level) tuples, pushed in reverse order so that they are popped
+    # (and formatted) in their original order.
+    # The header (if any) is the first line, or joined with the only other line.
+    result: list[str] = [header] if header else []
+    stack: list[tuple[BaseException, BaseExceptionGroup, int]] = [
+        (exc, exc_group, 0) for exc in reversed(exc_group.exceptions)
+    ]
+    while stack:
+        exc, group, level = stack.pop()
+        prefix = indent * level
+        if level:
+            prefix += "└> "
+        notes = fmt_notes(group, exc)
+        result.append(f"{prefix}{type(exc).__name__}: {exc} {notes}")
+        if isinstance(exc, BaseExceptionGroup):  # Includes ExceptionGroup
+            stack.extend((e, exc, level + 1) for e in reversed(exc.exceptions))
+
+    if header and len(result) == 2:
+        return header + " " + result[1]
 
     return "\n".join(result)
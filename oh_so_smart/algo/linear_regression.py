@@ -9,44 +9,44 @@ Licensed under the Open Software License version 3.0, a copy of which can be
 found in the LICENSE file.
 """
 
-from collections.abc import Collection
+from collections.abc import Iterable
 
-type Point = tuple[float, float]
 
+def best_fit(xs: Iterable[float], ys: Iterable[float]) -> tuple[float, float]:
+    """Calculate linear regression coeficients (b, m) for the curve y = b + m * x.
 
-def stats(dp: Collection[Point], i: int) -> float:
-    """Compute the average of a column of data.
-
-    Args:
-        df (list[Point]): Input data points
-        i (int): Index of point axis x or y to average
-
-    Returns:
-        float: The average of a column of data
-    """
-    ave = sum(p[i] for p in dp) / len(dp)
-
-    return ave
-
+    The slope is computed in the demeaned form m = Σ(x - x̄)(y - ȳ) / Σ(x - x̄)²,
+    which avoids the loss of precision of the Σxy and Σx² sums when the data
+    points are far from the origin (e.g. x values are large timestamps). The
+    means and the demeaned sums are updated together in a single pass over the
+    data points (Welford's online algorithm).
 
-def best_fit(dp: Collection[Point]) -> tuple[float, float]:
-    """Calculate linear regression coeficients (b, m) for the curve y = b + m * x.
+    The data points are given as separate sequences of x and y values (rather
+    than a sequence of (x, y) tuples), so that callers can pass their existing
+    containers, e.g. a range() of indices and a deque of sensor readings,
+    without allocating a tuple per data point.
 
     Args:
-        dp (list[Point]): List of input data points
+        xs (Iterable[float]): The x values of the input data points
+        ys (Iterable[float]): The y values of the input data points (same length)
 
     Returns:
         tuple[float, float]: (b, m) coefficients for the curve y = b + m * x
     """
-    ave_x = stats(dp, 0)
-    ave_y = stats(dp, 1)
-    m = sum(p[0] * (p[1] - ave_y) for p in dp) / sum(p[0] * (p[0] - ave_x) for p in dp)
+    ave_x = ave_y = sum_dxdy = sum_dxdx = 0.0
+    for n, (x, y) in enumerate(zip(xs, ys, strict=True), 1):
+        dx = x - ave_x
+        ave_x += dx / n
+        ave_y += (y - ave_y) / n
+        sum_dxdy += dx * (y - ave_y)
+        sum_dxdx += dx * (x - ave_x)
+    m = sum_dxdy / sum_dxdx
     b = ave_y - m * ave_x
 
     return (b, m)
 
 
-def predict(dp: Collection[Point], x: float) -> float:
-    """Comput value y = b + m * x for the given value x."""
-    b, m = best_fit(dp)
+def predict(fit: tuple[float, float], x: float) -> float:
+    """Comput value y = b + m * x for the given value x and (b, m) = best_fit()."""
+    b, m = fit
     return b + m * x
@@ -15,14 +15,14 @@ import signal
 
 _LOGGER = logging.getLogger(__name__)
 
+# Signal names by signal number, e.g. {2: 'SIGINT', 15: 'SIGTERM', ...}
+_SIG_NAMES: dict[int, str] = {int(sig): sig.name for sig in signal.Signals}
+
 
 class SignalException(Exception):
     def __init__(self, sig_num: int):
         self.sig_num = sig_num
-        try:
-            self.sig_name = signal.Signals(sig_num).name
-        except ValueError:
-            self.sig_name = "Uknown"
+        self.sig_name = _SIG_NAMES.get(sig_num, "Unknown")
 
         super().__init__(self.sig_name, self.sig_num)
 
@@ -33,10 +33,10 @@ class SignalException(Exception):
 class SignalMonitor:
     def __init__(self, loop: asyncio.AbstractEventLoop):
         self._loop = loop
-        self._sig_exc: SignalException | None = None
-        self._sig_event = asyncio.Event()
-        self._sig_event_wait_task: asyncio.Task | None = None
-        self._sig_event_wait_task_done = asyncio.Event()
+        # Resolved by the signal handler with a SignalException result. Created
+        # here (rather than in monitor()) so that a signal received before the
+        # call to monitor() is not lost.
+        self._sig_future: asyncio.Future[SignalException] = loop.create_future()
 
     @classmethod
     def instance(
@@ -54,32 +54,24 @@ class SignalMonitor:
             self._loop.add_signal_handler(signum, self._sig_handler, signum)
 
     async def cancel(self):
-        if self._sig_event_wait_task and self._sig_event_wait_task.cancel():
-            await self._sig_event_wait_task_done.wait()
+        self._sig_future.cancel()
 
     async def monitor(self, *, shielded: bool):
-        self._sig_event_wait_task = asyncio.create_task(
-            self._sig_event.wait(),
-            name="sig_event_wait_task",
-        )
-        self._sig_event_wait_task.add_done_callback(
-            lambda _task: self._sig_event_wait_task_done.set()
-        )
         if shielded:
-            await asyncio.shield(self._sig_event_wait_task)
+            await asyncio.shield(self._sig_future)
         else:
-            await self._sig_event_wait_task
+            await self._sig_future
 
-        raise self._sig_exc or Exception(
-            f"{type(self).__name__} {self.monitor.__name__}(): inconsistent state"
-        )
+        raise self._sig_future.result()
 
     def _sig_handler(self, signum: int, _frame: object | None = None):
-        self._sig_exc = SignalException(signum)
-        self._sig_event.set()
+        if self._sig_future.done():
+            return
+        sig_exc = SignalException(signum)
+        self._sig_future.set_result(sig_exc)
         _LOGGER.debug(
             "%s %s(): %s",
             type(self).__name__,
             self._sig_handler.__name__,
-            self._sig_exc,
+            sig_exc,
         )
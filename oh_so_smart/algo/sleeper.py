@@ -19,7 +19,8 @@ class RegularSleeper:
     12:10:03.035 - Sleep 1s - 35ms cumulative drift
     12:10:04.050 - Sleep 1s - 50ms cumulative drift
 
-    This class uses asyncio loop.call_at() to avoid cumulative drift, for example:
+    This class computes wake up times as multiples of the interval since the first
+    call to sleep(), which avoids cumulative drift, for example:
     12:10:00.000 - Sleep 1s
     12:10:01.010 - Sleep 1s - 10ms approximately constant drift
     12:10:02.015 - Sleep 1s - 10ms approximately constant drift
@@ -33,18 +34,11 @@ class RegularSleeper:
         self._t0 = 0.0
 
     async def sleep(self):
-        event = asyncio.Event()
         now = self._loop.time()
         if not self._t0:
             self._t0 = now
         n_intervals = (now - self._t0) // self._interval_sec
         wakeup_time = self._t0 + (n_intervals + 1) * self._interval_sec
-        # Note: call_at(ts, cb) calls the callback cb straight away if given a
-        # timestamp ts in the past.
-        handle = self._loop.call_at(wakeup_time, event.set)
-        # Note: event.wait() is interrupted with CancelledError if the caller
+        # Note: asyncio.sleep() is interrupted with CancelledError if the caller
         # task is cancelled, e.g. if a sibling TaskGroup task raises an error.
-        try:
-            await event.wait()
-        finally:
-            handle.cancel()
+        await asyncio.sleep(wakeup_time - now)
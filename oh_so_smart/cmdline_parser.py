@@ -6,11 +6,12 @@ Licensed under the Open Software License version 3.0, a copy of which can be
 found in the LICENSE file.
 """
 
-import argparse
+import sys
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class CmdArgs:
     config_file: str
 
@@ -21,7 +22,27 @@ def get_package_name() -> str:
     return basename(dirname(abspath(__file__)))
 
 
-def parse_command_line() -> CmdArgs:
+def parse_command_line(argv: Sequence[str] | None = None) -> CmdArgs:
+    """Parse the command line arguments (sys.argv[1:] by default).
+
+    The expected command lines, like ‘-c config.toml’, are parsed without
+    importing and setting up argparse, which takes a noticeable time on
+    devices like the Raspberry Pi Zero. Anything else, like ‘--help’ or
+    invalid arguments, is handed over to argparse.
+    """
+    args = sys.argv[1:] if argv is None else argv
+    match args:
+        case ["-c" | "--config-file", str() as config_file] if config_file[:1] != "-":
+            return CmdArgs(config_file=config_file)
+        case [str() as arg] if arg.startswith("--config-file="):
+            return CmdArgs(config_file=arg.partition("=")[2])
+
+    return _argparse_command_line(args)
+
+
+def _argparse_command_line(argv: Sequence[str]) -> CmdArgs:
+    import argparse
+
     parser = argparse.ArgumentParser(prog=get_package_name())
     parser.add_argument(
         "-c",
@@ -29,6 +50,6 @@ def parse_command_line() -> CmdArgs:
         required=True,
         help="TOML configuration file path",
     )
-    args = CmdArgs(**vars(parser.parse_args()))
+    args = CmdArgs(**vars(parser.parse_args(argv)))
 
     return args
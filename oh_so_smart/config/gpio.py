@@ -6,7 +6,7 @@ Licensed under the Open Software License version 3.0, a copy of which can be
 found in the LICENSE file.
 """
 
-from typing import Any, Literal, Optional, Self, override
+from typing import Literal, Optional, Self
 
 from pydantic import BaseModel, field_validator, model_validator
 
@@ -44,13 +44,11 @@ class GPIOConfig(BaseModel):
             )
         return self
 
-    # pylint incorrectly reports that the parent has a different number of arguments.
-    # pylint: disable=arguments-differ
-    @override
-    def model_post_init(self, context: Any):
+    @field_validator("pin", mode="after")
+    @classmethod
+    def translate_pin(cls, value: int) -> int:
         """Translate board header pin numbers to chip (Broadcom) pin numbers."""
-        self.pin = BOARD_TO_CHIP[self.pin]
-        super().model_post_init(context)
+        return BOARD_TO_CHIP[value]
 
 
 class GPIOPinConfig(BaseModel):
@@ -58,18 +56,16 @@ class GPIOPinConfig(BaseModel):
 
     The TOML configuration file use the Raspberry Pi board header pin numbering.
     This class automatically maps the pin numbers to the internal chip (Broadcom)
-    numbering through the `__post_init__` method.
+    numbering through the `translate_gpio_pin` field validator.
     """
 
     gpio_pin: int
 
-    # pylint incorrectly reports that the parent has a different number of arguments.
-    # pylint: disable=arguments-differ
-    @override
-    def model_post_init(self, context: Any):
+    @field_validator("gpio_pin", mode="after")
+    @classmethod
+    def translate_gpio_pin(cls, value: int) -> int:
         """Translate board header pin numbers to chip (Broadcom) pin numbers."""
-        self.gpio_pin = BOARD_TO_CHIP[self.gpio_pin]
-        super().model_post_init(context)
+        return BOARD_TO_CHIP[value]
 
 
 class W1GPIOConfig(BaseModel):
@@ -22,11 +22,18 @@ found in the LICENSE file.
 
 from typing import Final
 
+# The maps are stored as ‘bytes’ objects (all pin numbers fit in a byte): indexing
+# a ‘bytes’ object returns a small ‘int’ from the interpreter's small-int cache.
+# ‘bytes’ objects also support the buffer protocol, so native code can read the
+# maps as C ‘uint8_t’ arrays without copying, e.g. through memoryview(BOARD_TO_CHIP).
 # fmt: off
-BOARD_TO_CHIP: Final = (0, 0, 0, 2, 0, 3, 0, 4, 14, 0, 15, 17, 18, 27, 0, 22, 23, 0, 24, 10, 0, 9, 25, 11, 8, 0, 7, 0, 0, 5, 0, 6, 12, 13, 0, 19, 16, 26, 20, 0, 21)
-CHIP_TO_BOARD: Final = (0, 0, 3, 5, 7, 29, 31, 26, 24, 21, 19, 23, 32, 33, 8, 10, 36, 11, 12, 35, 38, 40, 15, 16, 18, 22, 37, 13)
+BOARD_TO_CHIP: Final = bytes((0, 0, 0, 2, 0, 3, 0, 4, 14, 0, 15, 17, 18, 27, 0, 22, 23, 0, 24, 10, 0, 9, 25, 11, 8, 0, 7, 0, 0, 5, 0, 6, 12, 13, 0, 19, 16, 26, 20, 0, 21))
+CHIP_TO_BOARD: Final = bytes((0, 0, 3, 5, 7, 29, 31, 26, 24, 21, 19, 23, 32, 33, 8, 10, 36, 11, 12, 35, 38, 40, 15, 16, 18, 22, 37, 13))
 # fmt: on
 
+# 40 header pins (1-40, index 0 unused), 28 GPIO pins (0-27)
+assert len(BOARD_TO_CHIP) == 41 and len(CHIP_TO_BOARD) == 28
+
 
 def board_to_chip(header_pin: int) -> int:
     return BOARD_TO_CHIP[header_pin]
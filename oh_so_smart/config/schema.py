@@ -137,7 +137,7 @@ class CoreConfig(BaseModel):
     gpio: list[GPIOConfig] = []
 
 
-@dataclass
+@dataclass(slots=True)
 class PreValidationConfig:
     config_dict: dict[str, Any]
     product_source_dir: str
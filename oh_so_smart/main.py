@@ -11,16 +11,12 @@ found in the LICENSE file.
 import asyncio
 import logging
 import signal
+from collections.abc import Callable
 
 from .algo.error import fmt_exception_group
 from .algo.signal_monitor import SignalException, SignalMonitor
 from .cmdline_parser import CmdArgs, parse_command_line
 from .config.schema import ConfigError, CoreConfig
-from .mqtt.manager import MQTTManager
-from .mqtt.queue import MsgQueue
-from .products.factory import Manager, ProductObjects, make_objects
-from .sensors.manager import TemperatureSensorManager
-from .switches.manager import HassSwitchManager
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -85,6 +81,14 @@ def _force_process_exit():
 
 
 async def _create_manager_tasks(args: CmdArgs, loop: asyncio.AbstractEventLoop):
+    # Deferred imports of the heavier modules (paho-mqtt, gpiod, w1thermsensor...)
+    # so that the signal handlers are installed as early as possible at startup.
+    from .mqtt.manager import MQTTManager
+    from .mqtt.queue import MsgQueue
+    from .products.factory import Manager, ProductObjects, make_objects
+    from .sensors.manager import TemperatureSensorManager
+    from .switches.manager import HassSwitchManager
+
     prod: ProductObjects = make_objects(args, loop)
     config: CoreConfig = prod.config
     send_queue = MsgQueue(loop, maxsize=50)
@@ -142,6 +146,9 @@ async def _create_top_level_tasks(
 async def _handle_top_level_exceptions(args: CmdArgs) -> int:
     exit_code = 0
     loop = asyncio.get_running_loop()
+    # Tasks start running synchronously when created, until their first await.
+    # Coroutines that complete without awaiting skip the event loop scheduling.
+    loop.set_task_factory(asyncio.eager_task_factory)
     signal_monitor: SignalMonitor | None = None
     try:
         signal_monitor = SignalMonitor.instance(loop)
@@ -181,6 +188,17 @@ async def _handle_top_level_exceptions(args: CmdArgs) -> int:
     return exit_code
 
 
+def _get_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return the ‘uvloop’ event loop factory, if the optional package is installed."""
+    try:
+        # pylint: disable-next=import-error
+        import uvloop  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        return None  # asyncio's default event loop
+    _LOGGER.debug("Using the uvloop event loop")
+    return uvloop.new_event_loop
+
+
 def main() -> int:
     logging.basicConfig(
         format="%(asctime)s %(levelname)-8s [%(name)s] %(message)s",
@@ -189,7 +207,9 @@ def main() -> int:
     )
     args = parse_command_line()
 
-    exit_code = asyncio.run(_handle_top_level_exceptions(args))
+    exit_code = asyncio.run(
+        _handle_top_level_exceptions(args), loop_factory=_get_loop_factory()
+    )
     if __debug__:
         _debug_pending_threads()
 
@@ -9,15 +9,25 @@ found in the LICENSE file.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class HA_MQTT_Entity_Strings:  # pylint: disable=invalid-name
     unique_id: str  # E.g. 'smart_thermostat_living_room_temperature'
     name: str  # E.g. 'living_room_temperature'
     state_topic: str  # E.g. 'smart_thermostat/living_room_temperature'
 
 
+# Translation table that lowercases ASCII letters and maps spaces to underscores.
+_ASCII_SLUG_TABLE = str.maketrans(
+    {**{chr(c): chr(c + 32) for c in range(ord("A"), ord("Z") + 1)}, " ": "_"}
+)
+
+
 def to_slug(name: str) -> str:
     """Convert a name like 'Smart Switch' to a slug identifier like 'smart_switch'."""
+    if name.isascii():
+        # Single pass over the (stripped) string
+        return name.strip().translate(_ASCII_SLUG_TABLE)
+    # str.lower() also handles non-ASCII letters
     return name.strip().lower().replace(" ", "_")
 
 
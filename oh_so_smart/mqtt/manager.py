@@ -198,13 +198,12 @@ class MQTTManager:
 
     async def _process_send_queue(self):
         try:
-            msg = await self._send_queue.get(timeout_sec=self.LOOP_WAIT_SEC)
+            msgs = await self._send_queue.get_many(timeout_sec=self.LOOP_WAIT_SEC)
         except TimeoutError:
             return
 
         high_priority: list[Msg] = []
         low_priority: list[Msg] = []
-        msgs = (msg, *self._send_queue.as_list())
         for msg in msgs:
             match msg.type:
                 case MsgType.ON_CONNECT:
@@ -213,7 +212,9 @@ class MQTTManager:
                 case MsgType.ON_EXIT:
                     self._on_exit_messages.append(msg)
                 case MsgType.MQTT_WILL:
-                    self._client.will_set(**msg.mqtt_args())
+                    self._client.will_set(
+                        msg.topic, msg.payload, msg.qos, msg.retain, msg.properties
+                    )
                 case MsgType.SUBSCRIBE:
                     self._on_connect_messages.append(msg)
                     high_priority.append(msg)
@@ -302,11 +303,16 @@ class MQTTManager:
             await self._wait_for_publish(pmsg.msg_info, pmsg.topic, timeout_sec)
 
     def _publish_nowait(self, msg: Msg) -> mqtt.MQTTMessageInfo:
-        payload = msg.payload
-        if payload and len(payload) > 20:
-            payload = payload[:17] + "..."
-        _LOGGER.debug("Publishing to '%s': '%s'", msg.topic, payload)
-        msg_info = self._client.publish(**msg.mqtt_args())
+        if __debug__:
+            payload = msg.payload
+            if isinstance(payload, bytes):
+                payload = payload.decode(errors="replace")
+            if payload and len(payload) > 20:
+                payload = payload[:17] + "..."
+            _LOGGER.debug("Publishing to '%s': '%s'", msg.topic, payload)
+        msg_info = self._client.publish(
+            msg.topic, msg.payload, msg.qos, msg.retain, msg.properties
+        )
         return msg_info
 
     async def _wait_for_publish(
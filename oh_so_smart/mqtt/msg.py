@@ -6,11 +6,13 @@ Licensed under the Open Software License version 3.0, a copy of which can be
 found in the LICENSE file.
 """
 
+from __future__ import annotations
 from dataclasses import dataclass
 from enum import auto, Enum
-from typing import Any
+from typing import TYPE_CHECKING
 
-from paho.mqtt.properties import Properties
+if TYPE_CHECKING:
+    from paho.mqtt.properties import Properties
 
 
 class MsgType(Enum):
@@ -20,20 +22,11 @@ class MsgType(Enum):
     SUBSCRIBE = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class Msg:
     topic: str
-    payload: str | None = None
+    payload: str | bytes | None = None
     qos: int = 2
     retain: bool = True
     properties: Properties | None = None
     type: MsgType | None = None
-
-    def mqtt_args(self) -> dict[str, Any]:
-        return {
-            "topic": self.topic,
-            "payload": self.payload,
-            "qos": self.qos,
-            "retain": self.retain,
-            "properties": self.properties,
-        }
@@ -7,18 +7,49 @@ found in the LICENSE file.
 """
 
 import asyncio
+import threading
+from collections.abc import Iterable
 
 
 class MsgQueue[T](asyncio.Queue):
     def __init__(self, loop: asyncio.AbstractEventLoop, maxsize: int = 0):
         self.__loop = loop
         self._cancelled = False
+        # Number of items handed over to the event loop thread by
+        # put_many_threadsafe() but not yet added to the queue. These reserve
+        # queue slots: full() counts them, so loop-side puts cannot take them.
+        self._threadsafe_pending = 0
+        self._threadsafe_lock = threading.Lock()
         super().__init__(maxsize)
 
+    def full(self) -> bool:
+        """Return True if there are maxsize items in the queue or reserved for it."""
+        return 0 < self.maxsize <= self.qsize() + self._threadsafe_pending
+
+    def put_nowait(self, item: T):
+        # The lock makes the full() check and the insertion atomic with respect
+        # to slot reservations by put_many_threadsafe(). asyncio.Queue.put()
+        # also ends up calling this method.
+        with self._threadsafe_lock:
+            super().put_nowait(item)
+
     async def get(self, timeout_sec: float | None = None) -> T:
         # Note that if a task gets cancelled (e.g. by a TaskGroup) while the task is
         # awaiting here, the await gets interrupted and CancelledError is raised here.
-        return await asyncio.wait_for(super().get(), timeout_sec)
+        if not self.empty():
+            return self.get_nowait()
+        if timeout_sec is None:
+            return await super().get()
+        async with asyncio.timeout(timeout_sec):
+            return await super().get()
+
+    async def put_many(self, items: Iterable[T]):
+        """Put several items in the queue, waiting for free slots like put()."""
+        for item in items:
+            if self.full():
+                await self.put(item)
+            else:
+                self.put_nowait(item)
 
     def put_threadsafe(self, item: T, timeout_sec: float | None = None):
         """Put an item in the queue, threadsafe.
@@ -34,25 +65,98 @@ class MsgQueue[T](asyncio.Queue):
             asyncio.QueueFull: If the queue is full and timeout_sec is zero.
             TimeoutError: On timeout, if timeout_sec is neither zero nor None.
         """
-
-        async def put():
+        if timeout_sec == 0:
+            self.put_nowait_threadsafe(item)
+        else:
             # timeout_sec is None -> block indefinetely (until the queue is not full)
-            # timeout_sec is zero -> do not block (may raise QueueFull)
-            return self.put_nowait(item) if timeout_sec == 0 else await self.put(item)
-
-        future = asyncio.run_coroutine_threadsafe(put(), self.__loop)
-        future.result(timeout_sec or None)
+            future = asyncio.run_coroutine_threadsafe(self.put(item), self.__loop)
+            try:
+                future.result(timeout_sec)
+            except TimeoutError:
+                # Cancel the pending put() so that the item is not added later
+                future.cancel()
+                raise
 
     def put_nowait_threadsafe(self, item: T):
-        self.put_threadsafe(item, timeout_sec=0)
+        """Put an item in the queue without blocking, threadsafe.
+
+        The item is handed over to the event loop thread with call_soon_threadsafe()
+        and this method returns without waiting for the event loop to run. Items
+        handed over but not yet added to the queue count towards maxsize, also for
+        puts made in the event loop thread, so that QueueFull is still raised in
+        the calling thread.
+
+        Raises:
+            asyncio.QueueFull: If the queue is full.
+        """
+        self.put_many_threadsafe((item,))
+
+    def put_many_threadsafe(self, items: Iterable[T]):
+        """Put several items in the queue without blocking, threadsafe.
+
+        Like put_nowait_threadsafe(), but a single event loop callback is scheduled
+        for all the items. Either all items are put in the queue or none is.
+
+        Raises:
+            asyncio.QueueFull: If there is not enough room in the queue for all items.
+        """
+        items = tuple(items)
+        with self._threadsafe_lock:
+            pending = self._threadsafe_pending + len(items)
+            if 0 < self.maxsize < self.qsize() + pending:
+                raise asyncio.QueueFull
+            self._threadsafe_pending = pending
+
+        self.__loop.call_soon_threadsafe(self._put_pending, items)
+
+    def _put_pending(self, items: tuple[T, ...]):
+        # Release the reserved slots and fill them in one step, so that no
+        # loop-side put can take them in between.
+        with self._threadsafe_lock:
+            self._threadsafe_pending -= len(items)
+            for item in items:
+                super().put_nowait(item)
+
+    async def get_many(
+        self, max_n: int | None = None, timeout_sec: float | None = None
+    ) -> list[T]:
+        """Wait for an item and get (remove) up to max_n items from the queue.
+
+        Args:
+            max_n (int | None, optional): Maximum number of items to return.
+              If None, return all the items in the queue.
+            timeout_sec (float | None, optional): Wait up to timeout_sec seconds
+              for an item and then raise TimeoutError. If None, wait indefinitely.
+
+        Raises:
+            TimeoutError: If the queue remained empty for timeout_sec seconds.
+        """
+        msgs = [await self.get(timeout_sec)]
+        msgs.extend(self._drain_deque(None if max_n is None else max_n - 1))
+        return msgs
 
     def as_list(self) -> list[T]:
-        """Get a list of messages currently in the queue."""
-        msgs = []
-        while True:
-            try:
-                msgs.append(self.get_nowait())
-            except asyncio.QueueEmpty:
+        """Get (and remove) a list of messages currently in the queue."""
+        return self._drain_deque()
+
+    def _drain_deque(self, max_n: int | None = None) -> list[T]:
+        """Remove up to max_n items from the queue, without calling get_nowait().
+
+        This relies on CPython's asyncio.Queue internals: items are stored in the
+        self._queue deque and get_nowait() wakes up a blocked put() (a waiter in
+        self._putters) for every item removed. Like get_nowait(), this does not
+        change the unfinished task count (see task_done()).
+        """
+        queue = self._queue  # pyright: ignore[reportAttributeAccessIssue]
+        putters = self._putters  # pyright: ignore[reportAttributeAccessIssue]
+        if max_n is None or max_n >= len(queue):
+            msgs = list(queue)
+            queue.clear()
+        else:
+            msgs = [queue.popleft() for _ in range(max_n)]
+        for _ in msgs:
+            if not putters:
                 break
+            self._wakeup_next(putters)  # pyright: ignore[reportAttributeAccessIssue]
 
         return msgs
@@ -45,10 +45,9 @@ from enum import StrEnum
 from typing import override
 
 from gpiod import LineRequest
-from gpiod.line import Value
 
 from ...config.schema import SwitchGroupConfig, SwitchConfig
-from ...switches.switches import Switch, SharedGPIOSwitch, SwitchGroup
+from ...switches.switches import GPIO_VALUES, Switch, SharedGPIOSwitch, SwitchGroup
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -64,13 +63,16 @@ class SwitchSlugs(StrEnum):
 
 def _find_switch_config(cfg: SwitchGroupConfig) -> tuple[SwitchConfig, SwitchConfig]:
     """Find the SwitchConfig objects for the EHW and GHW switches."""
-    by_slug = {sw_cfg.slug: sw_cfg for sw_cfg in cfg.switches}
-    try:
-        return (by_slug[SwitchSlugs.EHW], by_slug[SwitchSlugs.GHW])
-    except KeyError as exc:
-        raise Exception(
-            f"Virtual switch configuration not found ({','.join(SwitchSlugs)})"
-        ) from exc
+    ehw_cfg = ghw_cfg = None
+    for sw_cfg in cfg.switches:
+        if sw_cfg.slug == SwitchSlugs.EHW:
+            ehw_cfg = sw_cfg
+        elif sw_cfg.slug == SwitchSlugs.GHW:
+            ghw_cfg = sw_cfg
+        if ehw_cfg is not None and ghw_cfg is not None:
+            return (ehw_cfg, ghw_cfg)
+
+    raise Exception(f"Virtual switch configuration not found ({','.join(SwitchSlugs)})")
 
 
 def _make_virtual_switches(
@@ -83,8 +85,9 @@ def _make_virtual_switches(
     # ehw = electric hot water, ghw = gas hot water
     ehw_cfg, ghw_cfg = _find_switch_config(cfg)
 
-    select_state = bool(gpio_line.get_value(hw_select_pin))
-    hw_state = bool(gpio_line.get_value(ehw_cfg.gpio_pin))
+    select_value, hw_value = gpio_line.get_values([hw_select_pin, ehw_cfg.gpio_pin])
+    select_state = bool(select_value)
+    hw_state = bool(hw_value)
     ehw_state = hw_state and select_state
     ghw_state = hw_state and not select_state
 
@@ -131,6 +134,8 @@ class DualFuelSwitchGroup(SwitchGroup):
         # GPIO pin that selects between gas and electricity for hot water (hw) heating
         self._hw_select_pin = hw_select_pin
         self._gpio_line = gpio_line
+        self._ehw = self.by_slug[SwitchSlugs.EHW]  # Electric Hot Water virtual switch
+        self._ghw = self.by_slug[SwitchSlugs.GHW]  # Gas Hot Water virtual switch
 
     @override
     async def switch(
@@ -144,27 +149,36 @@ class DualFuelSwitchGroup(SwitchGroup):
             failsafe_msg: Log message for failsafe (keep-alive timeout) switching.
             now: Python time.monotonic() timestamp for keep-alive timeout computation.
         """
-        slug = switch.slug if switch else None
-        _LOGGER.debug("%s: slug=%s state=%s", type(self).__name__, slug, state)
-
-        ehw_slug = SwitchSlugs.EHW  # Electric Hot Water virtual switch
-        ghw_slug = SwitchSlugs.GHW  # Gas Hot Water virtual switch
-
-        if slug in (None, ehw_slug, ghw_slug):
-            ehw = self.by_slug[ehw_slug]
-            ghw = self.by_slug[ghw_slug]
-            target_ehw = state if slug in (None, ehw_slug) else ehw.state
-            target_ghw = state if slug in (None, ghw_slug) else ghw.state
+        if __debug__:
+            _LOGGER.debug(
+                "%s: slug=%s state=%s",
+                type(self).__name__,
+                switch.slug if switch else None,
+                state,
+            )
+
+        ehw = self._ehw
+        ghw = self._ghw
+        if switch is None or switch is ehw or switch is ghw:
+            target_ehw = state if switch is not ghw else ehw.state
+            target_ghw = state if switch is not ehw else ghw.state
             target_hw = target_ehw or target_ghw
             target_select = target_ehw
 
             def select_hw():
-                self._gpio_line.set_value(self._hw_select_pin, Value(target_select))
+                self._gpio_line.set_value(
+                    self._hw_select_pin, GPIO_VALUES[target_select]
+                )
 
             def switch_hw():
-                if slug in (None, ehw_slug):
+                if switch is None:
+                    # The EHW and GHW switches share the hot water GPIO pin, which
+                    # ghw.switch() sets according to the state of both switches.
+                    ehw.update_state(target_ehw, failsafe_msg, now)
+                    ghw.switch(target_ghw, failsafe_msg, now)
+                elif switch is ehw:
                     ehw.switch(target_ehw, failsafe_msg, now)
-                if slug in (None, ghw_slug):
+                else:
                     ghw.switch(target_ghw, failsafe_msg, now)
 
             # When turning HW on, first turn on the hot water select pin, then
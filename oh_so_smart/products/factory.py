@@ -58,17 +58,20 @@ def make_switches(
     group_cfg: SwitchGroupConfig, gpio_line: LineRequest
 ) -> tuple[Switch, ...]:
     mqtt_topic = group_cfg.mqtt_topic
-    return tuple(
-        Switch(
-            mqtt_name=sw.mqtt_name,
-            mqtt_topic=mqtt_topic,
-            gpio_pin=sw.gpio_pin,
-            gpio_line=gpio_line,
-            keep_alive_sec=group_cfg.keep_alive_timeout_sec,
-            slug=sw.slug,
+    switches: list[Switch] = []
+    for sw in group_cfg.switches:
+        switches.append(
+            Switch(
+                mqtt_name=sw.mqtt_name,
+                mqtt_topic=mqtt_topic,
+                gpio_pin=sw.gpio_pin,
+                gpio_line=gpio_line,
+                keep_alive_sec=group_cfg.keep_alive_timeout_sec,
+                slug=sw.slug,
+            )
         )
-        for sw in group_cfg.switches
-    )
+
+    return tuple(switches)
 
 
 def make_switch_group(
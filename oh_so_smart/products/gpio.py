@@ -22,6 +22,26 @@ from ..config.schema import CoreConfig
 
 GPIO_LINE_PATH = "/dev/gpiochip0"
 
+# Mapping of GPIOConfig field values to gpiod enum members
+_DIRECTIONS = {
+    "as_is": Direction.AS_IS,
+    "input": Direction.INPUT,
+    "output": Direction.OUTPUT,
+}
+_BIASES = {
+    "as_is": Bias.AS_IS,
+    "disabled": Bias.DISABLED,
+    "pull_up": Bias.PULL_UP,
+    "pull_down": Bias.PULL_DOWN,
+}
+_EDGES = {
+    "none": Edge.NONE,
+    "rising": Edge.RISING,
+    "falling": Edge.FALLING,
+    "both": Edge.BOTH,
+}
+_NO_DEBOUNCE = timedelta()
+
 
 class GPIOInterface:
     def __init__(self, line_request: LineRequest, gpio_cfgs: Iterable[GPIOConfig]):
@@ -36,15 +56,13 @@ def setup_gpio(gpio_cfgs: Iterable[GPIOConfig], gpio_consumer: str) -> GPIOInter
         Union[Iterable[Union[int, str]], int, str], Optional[LineSettings]
     ] = {
         g.pin: LineSettings(
-            direction=Direction[g.direction.upper()],
-            bias=Bias[g.bias.upper()] if g.bias else Bias.AS_IS,
-            edge_detection=(
-                Edge[g.edge_detection.upper()] if g.edge_detection else Edge.NONE
-            ),
+            direction=_DIRECTIONS[g.direction],
+            bias=_BIASES[g.bias] if g.bias else Bias.AS_IS,
+            edge_detection=_EDGES[g.edge_detection] if g.edge_detection else Edge.NONE,
             debounce_period=(
                 timedelta(milliseconds=g.debounce_period_ms)
                 if g.debounce_period_ms
-                else timedelta()
+                else _NO_DEBOUNCE
             ),
         )
         for g in gpio_cfgs
@@ -80,6 +98,6 @@ def setup_gpio_out_pins(cfg: CoreConfig) -> LineRequest:
     switch_pins = {sw.gpio_pin for group in cfg.switch_groups for sw in group.switches}
     other_out_pins = {g.pin for g in cfg.gpio if g.direction == "output"}
     return setup_grouped_out_pins(
-        tuple(switch_pins | other_out_pins),
+        tuple(sorted(switch_pins | other_out_pins)),
         gpio_consumer=cfg.product.slug,
     )
@@ -25,13 +25,30 @@ def is_debug():
     return __debug__ or bool_var("DEBUG")
 
 
+# Computed once, as they do not change between app restarts
+_MODULE_NAME = basename(dirname(abspath(__file__)))
+_PYTHON_FLAG = "-m" if is_debug() else "-Om"
+
+
+def get_app_args() -> list[str]:
+    return [
+        sys.executable,
+        _PYTHON_FLAG,
+        _MODULE_NAME,
+        *sys.argv[1:],  # Pass any other command-line arguments through
+    ]
+
+
+def exec_app():
+    """Replace the current process with the app (this function does not return)."""
+    args = get_app_args()
+    os.execv(args[0], args)
+
+
 async def start_app():
     _LOGGER.debug("argv[0] is '%s'", sys.argv[0])
     proc = await asyncio.create_subprocess_exec(
-        sys.executable,
-        "-m" if is_debug() else "-Om",
-        basename(dirname(abspath(__file__))),
-        *sys.argv[1:],  # Pass any other command-line arguments through
+        *get_app_args(),
         stdin=None,
         stdout=None,
         stderr=None,
@@ -54,10 +71,17 @@ async def start_app():
         raise exc
 
 
-async def run():
+async def run() -> bool:
+    """Run the app with supervised restarts.
+
+    Returns:
+        bool: True if the app should be started a final time with exec_app(),
+        False if execution was cancelled.
+    """
     restart_count = 0
     restart_max = 3
-    while restart_count < restart_max:
+    # The last run is not supervised: see exec_app() in __main__ below
+    while restart_count < restart_max - 1:
         if restart_count:
             _LOGGER.warning("Restarting app (%s of %s)", restart_count, restart_max)
         else:
@@ -75,9 +99,13 @@ async def run():
 
         restart_count += 1
     else:
-        _LOGGER.error("Too many app restarts: Aborting")
+        _LOGGER.warning(
+            "Restarting app (%s of %s) for the last time", restart_count, restart_max
+        )
+        return True
 
     _LOGGER.info("Exiting")
+    return False
 
 
 if __name__ == "__main__":
@@ -86,4 +114,12 @@ if __name__ == "__main__":
         level=logging.INFO,
         datefmt="%Y-%m-%d %H:%M:%S",
     )
-    asyncio.run(run())
+    if asyncio.run(run()):
+        # There will be no further restarts to supervise, so rather than keeping
+        # this Python interpreter in memory while waiting for the app to exit,
+        # replace it with the app. If the app exits, so does the container,
+        # which the Docker Engine may then restart. This happens after
+        # asyncio.run() has closed the event loop, and with output flushed.
+        sys.stdout.flush()
+        logging.shutdown()
+        exec_app()
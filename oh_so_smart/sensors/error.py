@@ -7,9 +7,16 @@ found in the LICENSE file.
 """
 
 import logging
+from typing import Final
 
 _LOGGER = logging.getLogger(__name__)
 
+# %-style formats of the sensor error messages, with the sensor name and exception
+_ERROR_MSG: Final = "Error reading '%s': %s"
+_WARNING_MSG: Final = (
+    _ERROR_MSG + ". Will retry often, but won't print this as often. (Err count %d)"
+)
+
 
 class SensorError(Exception):
     pass
@@ -25,14 +32,15 @@ class SensorErrorSession:
         self._err_last_skip_count = 0.0
 
     def _get_msg(self, exc: Exception) -> str:
-        return f"Error reading '{self._sensor_name}': {exc}"
+        return _ERROR_MSG % (self._sensor_name, exc)
 
     def add_error(self, exc: Exception) -> int:
         self._err_count += 1
         if self._err_skip_count <= 0:
             _LOGGER.warning(
-                "%s. Will retry often, but won't print this as often. (Err count %d)",
-                self._get_msg(exc),
+                _WARNING_MSG,
+                self._sensor_name,
+                exc,
                 self._err_count,
             )
             self._err_skip_count = 1.5 * (1 + self._err_last_skip_count)
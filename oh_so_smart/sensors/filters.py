@@ -8,11 +8,11 @@ found in the LICENSE file.
 
 import asyncio
 import logging
+from bisect import bisect_left, insort
 from collections import deque
 from collections.abc import Awaitable, Callable
-from itertools import islice
 
-from ..algo.linear_regression import predict, Point
+from ..algo.linear_regression import best_fit, predict
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,6 +49,9 @@ class NoiseFilter:
         self._window_amplitude = window_amplitude
         self._stability_delta = stability_delta
         self._noise_window = deque[float](maxlen=window_size)
+        # The values of _noise_window kept in ascending order, to find the median
+        # without sorting a copy of the window for every reading
+        self._sorted_window: list[float] = []
         self._previous_filtered_value = float("inf")
 
     def filter(self, value: float) -> float:
@@ -76,18 +79,29 @@ class NoiseFilter:
         Args:
             value (float): The latest sensor reading.
         """
-        self._noise_window.append(value)
-        start = len(self._noise_window)
-        for v in reversed(self._noise_window):
-            if abs(value - v) > self._window_amplitude:
-                self._noise_window = deque(
-                    islice(self._noise_window, start, len(self._noise_window)),
-                    maxlen=self._noise_window.maxlen,
-                )
-                break
-            start -= 1
-
-        median = sorted(self._noise_window)[len(self._noise_window) // 2]
+        window = self._noise_window
+        if len(window) == window.maxlen:
+            self._discard_oldest()
+        window.append(value)
+        sorted_window = self._sorted_window
+        insort(sorted_window, value)
+
+        # The smallest and largest values tell whether any value is too far from
+        # the new value, and only then the window is scanned for the values to drop.
+        amplitude = self._window_amplitude
+        if (
+            value - sorted_window[0] > amplitude
+            or sorted_window[-1] - value > amplitude
+        ):
+            start = len(window)
+            for v in reversed(window):
+                if abs(value - v) > amplitude:
+                    for _ in range(start):
+                        self._discard_oldest()
+                    break
+                start -= 1
+
+        median = sorted_window[len(sorted_window) // 2]
         if abs(median - self._previous_filtered_value) < self._stability_delta:
             filtered = self._previous_filtered_value
         else:
@@ -106,6 +120,10 @@ class NoiseFilter:
 
         return filtered
 
+    def _discard_oldest(self):
+        oldest = self._noise_window.popleft()
+        del self._sorted_window[bisect_left(self._sorted_window, oldest)]
+
 
 class OutlierFilter:
     """Filter outlier sensor readings out.
@@ -193,9 +211,10 @@ class OutlierFilter:
         return is_outlier
 
     def _predict_reading(self, actual_reading: float) -> float:
-        if len(self._outlier_window) > 1:
-            points: list[Point] = list(enumerate(self._outlier_window))
-            prediction = predict(points, len(self._outlier_window))
+        window_len = len(self._outlier_window)
+        if window_len > 1:
+            fit = best_fit(range(window_len), self._outlier_window)
+            prediction = predict(fit, window_len)
         else:
             prediction = actual_reading
 
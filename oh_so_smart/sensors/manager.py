@@ -13,7 +13,7 @@ from ..algo.sleeper import RegularSleeper
 from ..mqtt.msg import Msg, MsgType
 from ..mqtt.queue import MsgQueue
 from .error import SensorError
-from .sensors import TemperatureSensor, TemperatureSensorGroup
+from .sensors import TemperatureSensorGroup
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -53,32 +53,40 @@ class TemperatureSensorManager:
         # exception if any sibling task in a TaskGroup raises an exception,
         # or if a parent task is cancelled.
         while True:
-            async with asyncio.TaskGroup() as tg:
-                for sensor in group.sensors:
-                    tg.create_task(self._publish_temperature(sensor, group))
-
+            await self._publish_temperatures(group)
             await sleeper.sleep()
 
-    async def _publish_temperature(
-        self, sensor: TemperatureSensor, group: TemperatureSensorGroup
-    ):
-        try:
-            temp = await sensor.get_temperature()
-        except SensorError:
-            if group.tolerate_missing_sensors:
-                return
-            else:
-                raise
-
-        await self._send_queue.put(Msg(sensor.mqtt.state_topic, f"{temp:.2F}"))
+    async def _publish_temperatures(self, group: TemperatureSensorGroup):
+        """Read all sensors in the group and put the readings in the send queue.
+
+        The readings are put in the queue in one go, so that the MQTT manager can
+        publish them together.
+        """
+        results = await asyncio.gather(
+            *(sensor.get_temperature() for sensor in group.sensors),
+            return_exceptions=True,
+        )
+        msgs: list[Msg] = []
+        errors: list[BaseException] = []
+        for sensor, result in zip(group.sensors, results, strict=True):
+            if not isinstance(result, BaseException):
+                msgs.append(Msg(sensor.mqtt.state_topic, b"%.2F" % result))
+            elif not (
+                isinstance(result, SensorError) and group.tolerate_missing_sensors
+            ):
+                errors.append(result)
+
+        await self._send_queue.put_many(msgs)
+        if errors:
+            raise BaseExceptionGroup("Temperature sensor errors", errors)
 
     async def _register_with_home_assistant(self, group: TemperatureSensorGroup):
-        for sensor in group.sensors:
+        await self._send_queue.put_many(
             # HASS MQTT discovery message
-            await self._send_queue.put(
-                Msg(
-                    sensor.mqtt.config_topic,
-                    sensor.mqtt.hass_config(),
-                    type=MsgType.ON_CONNECT,
-                )
+            Msg(
+                sensor.mqtt.config_topic,
+                sensor.mqtt.hass_config(),
+                type=MsgType.ON_CONNECT,
             )
+            for sensor in group.sensors
+        )
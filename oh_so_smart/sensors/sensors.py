@@ -8,7 +8,6 @@ found in the LICENSE file.
 
 from __future__ import annotations
 import asyncio
-import dataclasses
 import json
 from dataclasses import dataclass
 
@@ -52,7 +51,7 @@ class MQTTSensor:
         # https://www.home-assistant.io/integrations/sensor.mqtt/
         return json.dumps(
             {
-                **dataclasses.asdict(self),
+                **vars(self),  # Not asdict(): no need to deep copy str and int fields
                 "force_update": True,
                 "expire_after": 600,  # seconds
                 "qos": 2,
@@ -143,15 +142,11 @@ class TemperatureSensor:
         return self._err_session
 
     async def get_temperature(self) -> float:
-        async def get_value_with_offset():
-            return await self.ds18b20.get_temperature() + self._offset
-
         while True:
             try:
-                # temperature = await self._filter_outlier(plus_offset)
                 temperature = await self._outlier_filter.filter(
                     max_calls=3,
-                    get_value=get_value_with_offset,
+                    get_value=self._get_value_with_offset,
                 )
             except (NoSensorFoundError, ResetValueError, SensorNotReadyError) as e:
                 err_count = self.error_session.add_error(e)
@@ -163,3 +158,6 @@ class TemperatureSensor:
 
             self._err_session = None
             return self._noise_filter.filter(temperature)
+
+    async def _get_value_with_offset(self) -> float:
+        return await self.ds18b20.get_temperature() + self._offset
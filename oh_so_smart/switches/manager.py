@@ -15,10 +15,13 @@ import paho.mqtt.client as pmcli
 
 from ..mqtt.msg import Msg, MsgType
 from ..mqtt.queue import MsgQueue
-from .switches import STATES, MQTTSwitch, Switch, SwitchGroup
+from .switches import STATE_OFF, STATE_ON, MQTTSwitch, Switch, SwitchGroup
 
 _LOGGER = logging.getLogger(__name__)
 
+# Switch state by MQTT command message payload
+_STATES_BY_PAYLOAD = {STATE_ON.encode(): True, STATE_OFF.encode(): False}
+
 
 class SwitchNotFoundError(Exception):
     pass
@@ -42,6 +45,12 @@ class HassSwitchManager:
         self._send_queue = send_queue
         self._recv_queue = recv_queue
         self._switch_groups = switch_groups
+        # Switch (and its group) by MQTT command topic, for the received messages
+        self._by_command_topic: dict[str, tuple[SwitchGroup, Switch]] = {
+            sw.mqtt.command_topic: (group, sw)
+            for group in switch_groups
+            for sw in group
+        }
         self._last_recv_msg: tuple[str, bytes | bytearray] | None = None
 
     async def start(self):
@@ -56,29 +65,26 @@ class HassSwitchManager:
             _LOGGER.info("%s: shutting down", type(self).__name__)
             await self._shutdown()
 
-    async def _register_mqtt_switch(self, sw: MQTTSwitch):
-        # For graceful exit
-        await self._send_queue.put(
-            Msg(sw.availability_topic, "offline", type=MsgType.ON_EXIT)
-        )
-        # For ungraceful exit
-        await self._send_queue.put(
-            Msg(sw.availability_topic, "offline", type=MsgType.MQTT_WILL)
-        )
-        # HASS MQTT discovery message
-        await self._send_queue.put(
-            Msg(sw.config_topic, sw.hass_config(), type=MsgType.ON_CONNECT)
+    def _get_registration_msgs(self, sw: MQTTSwitch) -> tuple[Msg, ...]:
+        return (
+            # For graceful exit
+            Msg(sw.availability_topic, "offline", type=MsgType.ON_EXIT),
+            # For ungraceful exit
+            Msg(sw.availability_topic, "offline", type=MsgType.MQTT_WILL),
+            # HASS MQTT discovery message
+            Msg(sw.config_topic, sw.hass_config(), type=MsgType.ON_CONNECT),
+            Msg(sw.availability_topic, "online", type=MsgType.ON_CONNECT),
+            # Subscribe to HASS on/off switch commands
+            Msg(sw.command_topic, type=MsgType.SUBSCRIBE),
         )
-        await self._send_queue.put(
-            Msg(sw.availability_topic, "online", type=MsgType.ON_CONNECT)
-        )
-        # Subscribe to HASS on/off switch commands
-        await self._send_queue.put(Msg(sw.command_topic, type=MsgType.SUBSCRIBE))
 
     async def _register_with_home_assistant(self):
-        for switch_group in self._switch_groups:
-            for sw in switch_group:
-                await self._register_mqtt_switch(sw.mqtt)
+        await self._send_queue.put_many(
+            msg
+            for switch_group in self._switch_groups
+            for sw in switch_group
+            for msg in self._get_registration_msgs(sw.mqtt)
+        )
 
     async def _monitor_mqtt_queue(self):
         """Consume the MQTT recv queue for on/off switch commands from Home Assistant."""
@@ -98,32 +104,27 @@ class HassSwitchManager:
                         )
                 continue
 
-            self._print_received_msg(msg)
+            if __debug__:
+                self._print_received_msg(msg)
 
             # Any message in the recv queue should be a switch on/off msg.
-            switch: Switch | None = None
-            switch_group: SwitchGroup | None = None
-            for group in self._switch_groups:
-                if switch := group.get_matching_switch(msg.topic):
-                    switch_group = group
-                    break
-            if not switch or not switch_group:
+            group_and_switch = self._by_command_topic.get(msg.topic)
+            if group_and_switch is None:
                 _LOGGER.error(
                     "Error: unexpected MQTT command message topic: %s",
                     msg.topic,
                 )
                 continue
+            switch_group, switch = group_and_switch
 
-            state = False
-            if msg.payload not in (b"ON", b"OFF"):
+            state = _STATES_BY_PAYLOAD.get(msg.payload)
+            if state is None:
                 _LOGGER.error(
                     "Error: unexpected MQTT payload '%s' for topic '%s'",
                     msg.payload,
                     msg.topic,
                 )
-            else:
-                if msg.payload == b"ON":
-                    state = True
+                state = False  # Failsafe
 
             await self._switch_and_update_mqtt_state(state, switch_group, switch)
 
@@ -131,7 +132,7 @@ class HassSwitchManager:
         self, state: bool, group: SwitchGroup, switch: Switch, failsafe_msg=""
     ):
         await group.switch(state, switch, failsafe_msg)
-        msg = Msg(switch.mqtt.state_topic, STATES[switch.state])
+        msg = switch.state_msg()
         # Impose a maximum wait time (wait_for()) because, as currently implemented,
         # the failsafe switch off on missing keepalive messages runs on the same loop
         # as the mqtt recv and send queues. The loop must not be allowed to block.
@@ -7,9 +7,10 @@ found in the LICENSE file.
 """
 
 from __future__ import annotations
-import dataclasses
+import heapq
 import json
 import logging
+import math
 import time
 from collections.abc import Iterator
 from dataclasses import dataclass
@@ -20,13 +21,15 @@ from gpiod.line import Value
 
 from ..config.schema import SwitchGroupConfig
 from ..mqtt.ha_naming import get_ha_mqtt_entity_strings, to_slug
+from ..mqtt.msg import Msg
 
 
 _LOGGER = logging.getLogger(__name__)
 
 STATE_ON = "ON"
 STATE_OFF = "OFF"
-STATES = [STATE_OFF, STATE_ON]
+STATES = (STATE_OFF, STATE_ON)  # Indexed by switch state (False, True)
+GPIO_VALUES = (Value.INACTIVE, Value.ACTIVE)  # Indexed by switch state
 
 
 @dataclass
@@ -63,7 +66,7 @@ class MQTTSwitch:
         # https://www.home-assistant.io/integrations/mqtt/#mqtt-discovery
         return json.dumps(
             {
-                **dataclasses.asdict(self),
+                **vars(self),  # Not asdict(): no need to deep copy str and int fields
                 "qos": 2,
                 "retain": True,
             }
@@ -86,6 +89,11 @@ class Switch:
     ):
         self.slug = slug or to_slug(mqtt_name)
         self.mqtt = MQTTSwitch.from_name(mqtt_topic, mqtt_name)
+        # MQTT state messages, indexed by switch state (False, True)
+        self._state_msgs = (
+            Msg(self.mqtt.state_topic, STATE_OFF),
+            Msg(self.mqtt.state_topic, STATE_ON),
+        )
         self._gpio_pin = gpio_pin
         self._gpio_line = gpio_line
         self._keep_alive_sec = keep_alive_sec
@@ -95,9 +103,14 @@ class Switch:
             self.state = bool(gpio_line.get_value(gpio_pin).value)
         else:
             self.state = state
-            gpio_line.set_value(gpio_pin, Value(state))
+            gpio_line.set_value(gpio_pin, GPIO_VALUES[state])
 
     def switch(self, state: bool, failsafe_msg="", now=0.0):
+        self.update_state(state, failsafe_msg, now)
+        self._set_gpio_pin()
+
+    def update_state(self, state: bool, failsafe_msg="", now=0.0):
+        """Like switch(), but without setting the GPIO pin value."""
         if failsafe_msg:
             self.failsafe_triggered = True
             _LOGGER.warning(
@@ -111,17 +124,30 @@ class Switch:
             self._last_command_timestamp = now or time.monotonic()
 
         self.state = state
-        self._set_gpio_pin()
 
     def _set_gpio_pin(self):
         """May be overridden for additional logic (e.g. SharedGPIOSwitch)."""
-        self._gpio_line.set_value(self._gpio_pin, Value(self.state))
+        self._gpio_line.set_value(self._gpio_pin, GPIO_VALUES[self.state])
 
-    def is_missing_keep_alive(self, now=0.0) -> bool:
+    def state_msg(self) -> Msg:
+        """Return the MQTT message that publishes the current switch state."""
+        return self._state_msgs[self.state]
+
+    @property
+    def keep_alive_sec(self) -> float:
+        return self._keep_alive_sec
+
+    def keep_alive_deadline(self) -> float:
+        """Return the time.monotonic() timestamp when the keep-alive period ends."""
         if not self._keep_alive_sec:
-            return False
-        now = now or time.monotonic()
-        return now - self._last_command_timestamp >= self._keep_alive_sec
+            return math.inf
+        return self._last_command_timestamp + self._keep_alive_sec
+
+    def is_missing_keep_alive(self, now=0.0) -> bool:
+        # Compared with keep_alive_deadline() rather than computing the elapsed
+        # time, so that this agrees with the deadlines in the SwitchGroup heap
+        # under floating point rounding.
+        return (now or time.monotonic()) >= self.keep_alive_deadline()
 
 
 class SharedGPIOSwitch(Switch):
@@ -158,7 +184,7 @@ class SharedGPIOSwitch(Switch):
     @override
     def _set_gpio_pin(self):
         state = self.state or any(s.state for s in self._other_switches)
-        self._gpio_line.set_value(self._gpio_pin, Value(state))
+        self._gpio_line.set_value(self._gpio_pin, GPIO_VALUES[state])
 
 
 class SwitchGroup:
@@ -184,16 +210,21 @@ class SwitchGroup:
         self.mqtt_topic = cfg.mqtt_topic
         self._switches = switches
         self.by_slug = {sw.slug: sw for sw in switches}
-        self.__last_sw_idx = -1
+        self._by_command_topic = {sw.mqtt.command_topic: sw for sw in switches}
+        # Min-heap of (keep-alive deadline, index, switch) entries, one entry per
+        # switch that has a keep-alive period. See find_missing_keepalive_switch().
+        self._keep_alive_deadlines = [
+            (sw.keep_alive_deadline(), i, sw)
+            for i, sw in enumerate(switches)
+            if sw.keep_alive_sec
+        ]
+        heapq.heapify(self._keep_alive_deadlines)
 
     def __iter__(self) -> Iterator[Switch]:
         yield from self._switches
 
     def get_matching_switch(self, mqtt_command_topic: str) -> Switch | None:
-        for sw in self:
-            if sw.mqtt.command_topic == mqtt_command_topic:
-                return sw
-        return None
+        return self._by_command_topic.get(mqtt_command_topic)
 
     async def switch(
         self, state: bool, switch: Switch | None = None, failsafe_msg="", now=0.0
@@ -216,13 +247,23 @@ class SwitchGroup:
             sw.switch(state, failsafe_msg, now)
 
     def find_missing_keepalive_switch(self, now: float) -> Switch | None:
-        """Return a switch (if any) that has missed its keep-alive message."""
-        n_switches = len(self._switches)
-        for _ in range(n_switches):
-            # Keep track of the last returned switch to continue the search in
-            # the next call to this method.
-            self.__last_sw_idx = (self.__last_sw_idx + 1) % n_switches
-            switch = self._switches[self.__last_sw_idx]
-            if not switch.failsafe_triggered and switch.is_missing_keep_alive(now):
-                return switch
+        """Return a switch (if any) that has missed its keep-alive message.
+
+        Only the switches whose keep-alive deadline is due are checked. A deadline
+        in the heap may be earlier than the switch's actual deadline, when the
+        switch has received commands since it was pushed, but it is never later.
+        """
+        deadlines = self._keep_alive_deadlines
+        while deadlines and deadlines[0][0] <= now:
+            _, idx, sw = deadlines[0]
+            missing = not sw.failsafe_triggered and sw.is_missing_keep_alive(now)
+            # Replace the entry with the switch's current deadline, or with one
+            # keep-alive period from now if the deadline has already passed (the
+            # switch is missing or has already been switched off by the failsafe).
+            deadline = sw.keep_alive_deadline()
+            if deadline <= now:
+                deadline = now + sw.keep_alive_sec
+            heapq.heapreplace(deadlines, (deadline, idx, sw))
+            if missing:
+                return sw
         return None
@@ -8,21 +8,23 @@ found in the LICENSE file.
 
 import unittest
 
-from ...algo.linear_regression import Point, predict
+from ...algo.linear_regression import best_fit, predict
 
 
 class TestLinearRegression(unittest.TestCase):
     def test_best_fit_predict(self):
-        test_inputs: list[tuple[list[Point], tuple[float, float]]] = [
-            ([(0, 0), (1, 1)], (2, 2)),
-            ([(1, 2), (2, 3), (3, 4)], (4, 5)),
-            ([(3.0, 3.5), (5.0, 5.0), (10.0, 5.0)], (7, 4.67307692)),
+        test_inputs: list[tuple[list[float], list[float], tuple[float, float]]] = [
+            ([0, 1], [0, 1], (2, 2)),
+            ([1, 2, 3], [2, 3, 4], (4, 5)),
+            ([3.0, 5.0, 10.0], [3.5, 5.0, 5.0], (7, 4.67307692)),
+            # Data points far from the origin, e.g. x values are timestamps
+            ([1e9, 1e9 + 1, 1e9 + 2], [20.0, 20.5, 21.0], (1e9 + 3, 21.5)),
         ]
-        for data_points, prediction in test_inputs:
+        for xs, ys, prediction in test_inputs:
             given_x, expected_y = prediction
-            # b, m = best_fit(data_points)
-            # print(f"y = {b} + {m} * x, predict({given_x})={predict(data_points, given_x)}")
-            self.assertAlmostEqual(predict(data_points, given_x), expected_y)
+            fit = best_fit(xs, ys)
+            # print(f"y = {fit[0]} + {fit[1]} * x, predict({given_x})={predict(fit, given_x)}")
+            self.assertAlmostEqual(predict(fit, given_x), expected_y)
 
 
 # Tests can be run with the command line:
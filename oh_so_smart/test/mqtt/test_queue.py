@@ -0,0 +1,92 @@
+"""Test code for the mqtt.queue module.
+
+Copyright (C) 2025 Paulo Ferreira de Castro
+
+Licensed under the Open Software License version 3.0, a copy of which can be
+found in the LICENSE file.
+"""
+
+import asyncio
+import unittest
+
+from ...mqtt.queue import MsgQueue
+
+
+class TestMsgQueue(unittest.IsolatedAsyncioTestCase):
+    async def test_put_nowait_threadsafe(self):
+        queue = MsgQueue[int](asyncio.get_running_loop(), maxsize=3)
+
+        def put_items():
+            for i in range(3):
+                queue.put_nowait_threadsafe(i)
+            # Pending items (not yet added by the event loop) count towards maxsize
+            with self.assertRaises(asyncio.QueueFull):
+                queue.put_nowait_threadsafe(3)
+
+        await asyncio.to_thread(put_items)
+        self.assertEqual([await queue.get(timeout_sec=1) for _ in range(3)], [0, 1, 2])
+        self.assertTrue(queue.empty())
+
+    async def test_threadsafe_reservation_vs_loop_put(self):
+        queue = MsgQueue[int](asyncio.get_running_loop(), maxsize=2)
+        queue.put_nowait(0)
+        # The event loop callback is scheduled but does not run before the
+        # next await, so the slot stays reserved, not filled.
+        queue.put_nowait_threadsafe(1)
+        self.assertEqual(queue.qsize(), 1)
+        self.assertTrue(queue.full())
+        with self.assertRaises(asyncio.QueueFull):
+            queue.put_nowait(2)
+        # A loop-side put() waits rather than taking the reserved slot
+        put_task = asyncio.create_task(queue.put(2))
+        await asyncio.sleep(0)
+        self.assertFalse(put_task.done())
+        self.assertEqual(await queue.get(timeout_sec=1), 0)
+        await asyncio.wait_for(put_task, 1)
+        self.assertEqual(queue.as_list(), [1, 2])
+
+    async def test_put_threadsafe_timeout(self):
+        queue = MsgQueue[int](asyncio.get_running_loop(), maxsize=1)
+        await asyncio.to_thread(queue.put_threadsafe, 0, timeout_sec=1)
+        with self.assertRaises(TimeoutError):
+            await asyncio.to_thread(queue.put_threadsafe, 1, timeout_sec=0.01)
+        self.assertEqual(await queue.get(timeout_sec=1), 0)
+
+    async def test_as_list(self):
+        queue = MsgQueue[int](asyncio.get_running_loop(), maxsize=2)
+        queue.put_nowait(0)
+        queue.put_nowait(1)
+        # A put() blocked on the full queue is woken up by as_list()
+        put_task = asyncio.create_task(queue.put(2))
+        await asyncio.sleep(0)
+        self.assertFalse(put_task.done())
+        self.assertEqual(queue.as_list(), [0, 1])
+        await asyncio.wait_for(put_task, 1)
+        self.assertEqual(queue.as_list(), [2])
+        self.assertEqual(queue.as_list(), [])
+
+    async def test_put_many_get_many(self):
+        queue = MsgQueue[int](asyncio.get_running_loop(), maxsize=4)
+        with self.assertRaises(asyncio.QueueFull):
+            await asyncio.to_thread(queue.put_many_threadsafe, range(5))
+        await asyncio.to_thread(queue.put_many_threadsafe, range(3))
+        self.assertEqual(await queue.get_many(2, timeout_sec=1), [0, 1])
+        self.assertEqual(await queue.get_many(timeout_sec=1), [2])
+        with self.assertRaises(TimeoutError):
+            await queue.get_many(timeout_sec=0.01)
+
+    async def test_put_many(self):
+        queue = MsgQueue[int](asyncio.get_running_loop(), maxsize=2)
+        # put_many() waits for free slots when the queue is full
+        put_task = asyncio.create_task(queue.put_many(range(3)))
+        await asyncio.sleep(0)
+        self.assertFalse(put_task.done())
+        self.assertEqual(queue.as_list(), [0, 1])
+        await asyncio.wait_for(put_task, 1)
+        self.assertEqual(queue.as_list(), [2])
+
+
+# Tests can be run with the command line:
+# python -m unittest oh_so_smart.test.mqtt.test_queue
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+"""Test code for the scripts/common.py module.
+
+Copyright (C) 2025 Paulo Ferreira de Castro
+
+Licensed under the Open Software License version 3.0, a copy of which can be
+found in the LICENSE file.
+"""
+
+import asyncio
+import sys
+import unittest
+from inspect import CORO_CLOSED, getcoroutinestate
+from os.path import abspath, dirname, join
+
+# The scripts import each other as top-level modules, e.g. ‘from common import …’
+sys.path.insert(0, join(dirname(abspath(__file__)), "..", "..", "..", "scripts"))
+
+# pylint: disable=import-error,wrong-import-position
+from common import max_gather  # pyright: ignore[reportMissingImports]
+
+
+class TestMaxGather(unittest.IsolatedAsyncioTestCase):
+    async def test_results_in_order(self):
+        async def value(i: int, delay: float):
+            await asyncio.sleep(delay)
+            return i
+
+        coros = [value(i, 0.01 * (4 - i)) for i in range(5)]
+        self.assertEqual(await max_gather(2, *coros), [0, 1, 2, 3, 4])
+        self.assertEqual(await max_gather(2), [])
+
+    async def test_error_closes_pending_coroutines(self):
+        async def fail():
+            raise ValueError
+
+        async def never_run():
+            self.fail("Coroutine started after an error")
+
+        coros = [fail(), *(never_run() for _ in range(3))]
+        with self.assertRaises(ValueError):
+            await max_gather(1, *coros)
+        # Closed rather than left unawaited, which would warn when collected
+        states = [getcoroutinestate(coro) for coro in coros]
+        self.assertEqual(states, [CORO_CLOSED] * len(coros))
+
+
+# Tests can be run with the command line:
+# python -m unittest oh_so_smart.test.scripts.test_common
+if __name__ == "__main__":
+    unittest.main()
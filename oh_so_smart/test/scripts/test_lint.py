@@ -0,0 +1,57 @@
+"""Test code for the scripts/lint.py script.
+
+Copyright (C) 2025 Paulo Ferreira de Castro
+
+Licensed under the Open Software License version 3.0, a copy of which can be
+found in the LICENSE file.
+"""
+
+import io
+import os
+import sys
+import unittest
+from contextlib import redirect_stdout
+from os.path import abspath, dirname, join
+from unittest.mock import patch
+
+# The scripts import each other as top-level modules, e.g. ‘from common import …’
+sys.path.insert(0, join(dirname(abspath(__file__)), "..", "..", "..", "scripts"))
+
+# pylint: disable=import-error,wrong-import-position,protected-access
+import lint  # pyright: ignore[reportMissingImports]
+from common import SubprocessError  # pyright: ignore[reportMissingImports]
+
+
+class TestRunSubcommand(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        cwd = os.getcwd()
+        self.addCleanup(os.chdir, cwd)  # _run_subcommand() changes directory
+
+    async def test_concurrent_tool_failure(self):
+        async def failing_tool():
+            await lint._exec(sys.executable, "-c", "print('tool output'); exit(3)")
+
+        async def passing_tool():
+            await lint._exec(sys.executable, "-c", "pass")
+
+        opts = lint.Opts(tools=["ruff-check", "pyright"], jobs=2)
+        with (
+            patch.object(lint, "_run_ruff_check", failing_tool),
+            patch.object(lint, "_run_pyright", passing_tool),
+            redirect_stdout(io.StringIO()) as stdout,
+            self.assertLogs(lint._logger),
+            self.assertRaises(SubprocessError) as cm,
+        ):
+            await lint._run_subcommand(opts)
+
+        # The captured output is printed once, and not repeated in the error
+        self.assertEqual(stdout.getvalue().count("tool output"), 1)
+        msg = str(cm.exception)
+        self.assertIn("non-zero exit code ‘3’", msg)
+        self.assertNotIn("tool output", msg)
+
+
+# Tests can be run with the command line:
+# python -m unittest oh_so_smart.test.scripts.test_lint
+if __name__ == "__main__":
+    unittest.main()
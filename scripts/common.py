@@ -16,6 +16,7 @@ import logging
 import os
 import sys
 from asyncio.subprocess import DEVNULL, PIPE, Process
+from functools import lru_cache
 
 
 class CommandLineError(Exception):
@@ -140,14 +141,29 @@ def add_common_options(
 
 
 async def max_gather(max_concurrent: int, *coros: Coroutine[None, Any, Any]):
-    """Use asyncio.gather() to run at most ‘max_concurrent’ coroutines at a time."""
-    semaphore = asyncio.Semaphore(max_concurrent)
+    """Use asyncio.gather() to run at most ‘max_concurrent’ coroutines at a time.
 
-    async def sem_coro(coro):
-        async with semaphore:
-            return await coro
+    Rather than creating a task per coroutine, with most of them waiting on a
+    semaphore, ‘max_concurrent’ worker tasks take turns awaiting the coroutines.
+    Like asyncio.gather(), return the results in the order of the coroutines.
+    """
+    results: list[Any] = [None] * len(coros)
+    pending = iter(enumerate(coros))
+
+    async def worker():
+        for i, coro in pending:
+            results[i] = await coro
 
-    return await asyncio.gather(*(sem_coro(c) for c in coros))
+    try:
+        await asyncio.gather(
+            *(worker() for _ in range(min(max_concurrent, len(coros))))
+        )
+    finally:
+        # If a coroutine raised, close the ones that no worker has awaited yet,
+        # which also stops the remaining workers from taking any further ones.
+        for _, coro in pending:
+            coro.close()
+    return results
 
 
 async def communicate(
@@ -193,8 +209,9 @@ async def communicate(
     try:
         exit_code = cast(int, await anext(agen))
     except SubprocessError as e:
-        e.stderr = err
-        e.stdout = out
+        # None if not captured, e.g. with stderr=STDOUT
+        e.stderr = err or b""
+        e.stdout = out or b""
         raise
     return out, err, exit_code
 
@@ -225,18 +242,11 @@ async def wait_exec(
     Returns:
         int: Subprocess exit code.
     """
-    agen = aexec(
-        *args,
-        log=log,
-        raise_on_error=raise_on_error,
-        shell=shell,
-        stdin=stdin,
-        stdout=stdout,
-        stderr=stderr,
-        **kwargs,
+    proc = await _launch(
+        args, log=log, shell=shell, stdin=stdin, stdout=stdout, stderr=stderr, **kwargs
     )
-    _proc = await anext(agen)
-    exit_code = cast(int, await anext(agen))
+    exit_code = await proc.wait()
+    _check_exit_code(args, exit_code, raise_on_error)
     return exit_code
 
 
@@ -270,73 +280,101 @@ async def aexec(
         stdout: Subprocess stdout. See asyncio.create_subprocess_exec().
         stderr: Subprocess stderr. See asyncio.create_subprocess_exec().
     """
-    if log:
-        largs = ["+", *args] if log is print else ["+" + " %s" * len(args), *args]
-        log(*largs)
-    sub = asyncio.create_subprocess_shell if shell else asyncio.create_subprocess_exec
-    proc = await sub(*args, stdin=stdin, stdout=stdout, stderr=stderr, **kwargs)
+    proc = await _launch(
+        args, log=log, shell=shell, stdin=stdin, stdout=stdout, stderr=stderr, **kwargs
+    )
     yield proc
     exit_code = await proc.wait()
+    _check_exit_code(args, exit_code, raise_on_error)
+    yield exit_code
+
+
+async def _launch(
+    args: tuple, log: Callable[..., None] | None, shell: bool, **kwargs
+) -> Process:
+    """Log the command line and create the subprocess. Used by aexec() and wait_exec()."""
+    if log is print:
+        print("+", *args)
+    elif log:
+        log(_log_format(len(args)), *args)
+    sub = asyncio.create_subprocess_shell if shell else asyncio.create_subprocess_exec
+    return await sub(*args, **kwargs)
+
+
+@lru_cache
+def _log_format(n_args: int) -> str:
+    """Return the ‘+ %s %s ...’ command line logging format for ‘n_args’ arguments."""
+    return "+" + " %s" * n_args
+
+
+def _check_exit_code(args: tuple, exit_code: int, raise_on_error: bool):
+    """Raise SubprocessError if ‘exit_code’ is not zero and ‘raise_on_error’ is True."""
     if exit_code and raise_on_error:
         raise SubprocessError(
-            f"‘{args[0]}’: non-zero exit code ‘{exit_code}’", exit_code
+            f"‘{args[0]}’: non-zero exit code ‘{exit_code}’", exit_code=exit_code
         )
-    yield exit_code
 
 
-async def pipe_subproc(cmd1: Sequence[str], cmd2: Sequence[str]) -> tuple[int, int]:
-    """Pipe stdout of ‘cmd1’ subprocess to stdin of ‘cmd2’, and return their exit codes.
+async def pipe_subproc(*cmds: Sequence[str]) -> tuple[int, ...]:
+    """Pipe stdout of each subprocess to stdin of the next, and return their exit codes.
 
     Args:
-        cmd1 (Iterable[str]): Executable arguments of 1st subprocess
-        cmd2 (Iterable[str]): Executable arguments of 2nd subprocess
+        *cmds (Sequence[str]): Executable arguments of each subprocess, in
+          pipeline order, e.g. (cmd1, cmd2) for ‘cmd1 | cmd2’.
 
     Returns:
-        tuple[int, int]: Exit codes of 1st and 2nd subprocesses
+        tuple[int, ...]: Exit codes of the subprocesses, in pipeline order
     """
     from asyncio import (
         as_completed,
         create_subprocess_exec,
         create_task,
         CancelledError,
-        Task,
+        Future,
     )
     from os.path import basename
 
-    def get_status_code(task_name: str, task: Task, other_proc: Process) -> int:
+    def get_status_code(task_name: str, task: Future[int], procs: list[Process]) -> int:
         code = 1 if task.cancelled() else task.result()
         _logger.debug(
             "%s: %s completed with code %s", pipe_subproc.__name__, task_name, code
         )
-        # If a task (subprocess) failed, terminate the other one early.
-        if code and other_proc.returncode is None:
-            other_proc.terminate()
+        # If a task (subprocess) failed, terminate the other ones early.
+        if code:
+            for proc in procs:
+                if proc.returncode is None:
+                    proc.terminate()
         return code
 
-    rd, wr = os.pipe()
-    _logger.info("+ %s | %s", " ".join(cmd1), " ".join(cmd2))
-    proc1 = await create_subprocess_exec(*cmd1, stdout=wr)
-    os.close(wr)
-    proc2 = await create_subprocess_exec(*cmd2, stdin=rd)
-    os.close(rd)
-    task1, task2 = (create_task(proc1.wait()), create_task(proc2.wait()))
-    name1, name2 = basename(cmd1[0]), basename(cmd2[0])
+    _logger.info("+ %s", " | ".join(" ".join(cmd) for cmd in cmds))
+    procs: list[Process] = []
+    rd: int | None = None
+    for i, cmd in enumerate(cmds):
+        stdin = rd
+        rd, wr = os.pipe() if i < len(cmds) - 1 else (None, None)
+        procs.append(await create_subprocess_exec(*cmd, stdin=stdin, stdout=wr))
+        for fd in (stdin, wr):
+            if fd is not None:
+                os.close(fd)
+    # Task -> index of its subprocess in pipeline order
+    tasks: dict[Future[int], int] = {
+        create_task(proc.wait()): i for i, proc in enumerate(procs)
+    }
 
     # Subprocess exit status code. 0 indicates success. “A negative value -N
     # indicates that the child was terminated by signal N (POSIX only).”
-    code1, code2 = 1, 1
+    codes = [1] * len(cmds)
     try:
         async for earliest in as_completed(  # pylint: disable=not-an-iterable
-            (task1, task2)
+            tasks
         ):  # pyright: ignore[reportGeneralTypeIssues]
-            if earliest is task1:
-                code1 = get_status_code(f"task1 ({name1})", task1, proc2)
-            else:
-                code2 = get_status_code(f"task2 ({name2})", task2, proc1)
+            i = tasks[earliest]
+            name = f"task{i + 1} ({basename(cmds[i][0])})"
+            codes[i] = get_status_code(name, earliest, procs)
     except CancelledError as e:
         _logger.debug("%s: %s", pipe_subproc.__name__, e.__class__.__name__)
 
-    return code1, code2
+    return tuple(codes)
 
 
 def check_python_version(min_major, min_minor, *, print_and_exit=False):
@@ -59,9 +59,15 @@ class FlatConfig:
     config_file_dirname: str
 
     _char_cleaner = re.compile(r"[^A-Za-z0-9._-]")
+    # Same as _char_cleaner, as a str.translate() table for ASCII names
+    _ascii_char_cleaner = str.maketrans(
+        {chr(c): "_" for c in range(128) if not (chr(c).isalnum() or chr(c) in "._-")}
+    )
 
     @staticmethod
     def clean_chars(name: str) -> str:
+        if name.isascii():
+            return name.translate(FlatConfig._ascii_char_cleaner)
         return FlatConfig._char_cleaner.sub("_", name)
 
     @staticmethod
@@ -20,18 +20,22 @@ import platform
 import shlex
 import sys
 import textwrap
-from asyncio.subprocess import DEVNULL
+from asyncio.subprocess import DEVNULL, PIPE, Process
+from contextlib import suppress
 from dataclasses import dataclass
+from glob import glob
 from os.path import abspath, basename, exists, join
+from pathlib import PurePosixPath, PureWindowsPath
 from shutil import which
+from typing import cast
 
 from common import (
     CommandLineError,
     SubprocessError,
     ValidationError,
     add_common_options,
+    aexec,
     check_python_version,
-    communicate,
     configure_logging,
     pipe_subproc,
     set_logging_level,
@@ -91,31 +95,30 @@ class Opts:
     sudo: bool
 
 
+_REDIRECT_PREFIXES = ("<", ">", "2>", "&>", "|")
+
+
 async def _print_or_exec(opts: Opts, *args: str, **kwargs):
     if not opts.print_command_lines:
         return await wait_exec(*args, **kwargs)
 
-    def is_redirect(x: str) -> bool:
-        for c in ("<", ">", "2>", "&>", "|"):
-            if x.startswith(c):
-                return True
-        return False
+    quoted: list[str] = []
+    has_redirect = False
+    for arg in args:
+        if arg.startswith(_REDIRECT_PREFIXES):
+            has_redirect = True
+            quoted.append(arg)
+        else:
+            quoted.append(shlex.quote(arg))
 
-    if (
-        os.name == "posix"
-        and kwargs.get("stderr") == DEVNULL
-        and not any(is_redirect(arg) for arg in args)
-    ):
-        args = args + ("2>/dev/null",)
+    if os.name == "posix" and kwargs.get("stderr") == DEVNULL and not has_redirect:
+        quoted.append("2>/dev/null")
 
-    quoted = [arg if is_redirect(arg) else shlex.quote(arg) for arg in args]
     print("+##", " ".join(quoted))
 
 
 def _validate_build_directories(opts: Opts, cfg: FlatConfig):
     def is_root_dir(path: str) -> bool:
-        from pathlib import PurePosixPath, PureWindowsPath
-
         ppath = PurePosixPath(path)
         wpath = PureWindowsPath(path)
         return (len(ppath.parts) == 1 and ppath.root == "/") or (
@@ -166,6 +169,7 @@ async def _docker_build(opts: Opts, cfg: FlatConfig):
     # use ‘buildx build’ and push the image to the GitHub Container Registry.
     if os.environ.get("CI"):
         out_type = "registry" if opts.publish else "image"
+        cache_ref = f"{REGISTRY_IMAGE_NAME}:buildcache-{cfg.deployment_python_distro}"
         build_cmd = [
             "buildx",
             "build",
@@ -175,6 +179,15 @@ async def _docker_build(opts: Opts, cfg: FlatConfig):
             f"--annotation=index:org.opencontainers.image.description={INDEX_ANNOTATION_DESCRIPTION}",
             f"--annotation=index:org.opencontainers.image.source={INDEX_ANNOTATION_SOURCE}",
             f"--annotation=index:org.opencontainers.image.licenses={INDEX_ANNOTATION_LICENCE}",
+            # Reuse the layers of previous CI builds (e.g. ‘pip install’) through
+            # a registry cache. The cache is only exported when publishing, as
+            # exporting requires push access to the registry.
+            f"--cache-from=type=registry,ref={cache_ref}",
+            *(
+                [f"--cache-to=type=registry,ref={cache_ref},mode=max"]
+                if opts.publish
+                else []
+            ),
         ]
     else:
         build_cmd = ["build"]
@@ -197,7 +210,10 @@ async def _docker_save(opts: Opts, cfg: FlatConfig):
 
     The idea is to run ‘docker save’ on the workstation and ‘docker load’
     on the target device, piping the former’s stdout to the latter’s stdin
-    over ssh.
+    over ssh. If ‘pigz’ or ‘gzip’ is found on the workstation, the image is
+    compressed on the way, as ‘docker load’ transparently decompresses gzip
+    input. Images typically compress several times, which shortens the
+    transfer on any link that is not CPU-bound.
 
     Assumptions:
     - The Docker image was previosly built on the workstation with the
@@ -224,27 +240,42 @@ async def _docker_save(opts: Opts, cfg: FlatConfig):
         "load",
     ]
     ssh_cmd = [which("ssh") or "ssh", cfg.deployment_ssh_host_name, *remote_cmd]
+    gzip = which("pigz") or which("gzip")
+    cmds = [save_cmd, [gzip, "-1"], ssh_cmd] if gzip else [save_cmd, ssh_cmd]
 
     if opts.print_command_lines:
-        await _print_or_exec(opts, *save_cmd, "|", *ssh_cmd)
+        pipeline = [arg for cmd in cmds for arg in ("|", *cmd)][1:]
+        await _print_or_exec(opts, *pipeline)
         return
 
-    docker_code, ssh_code = await pipe_subproc(save_cmd, ssh_cmd)
-    if docker_code or ssh_code:
+    codes = await pipe_subproc(*cmds)
+    if any(codes):
         _logger.error(
-            "%s: Operation failed with docker exit code %d and ssh exit code %d.",
+            "%s: Operation failed with exit codes %s (%s).",
             _docker_save.__name__,
-            docker_code,
-            ssh_code,
+            codes,
+            " | ".join(basename(cmd[0]) for cmd in cmds),
         )
     else:
         _logger.info("Docker image transferred successfully 🎉")
 
 
-async def _docker_run(opts: Opts, cfg: FlatConfig):
-    from glob import glob
-    from itertools import chain
+_SECURITY_OPTS = ("--security-opt", "label=disable")  # Fedora IoT SELinux
+# Environment variables passed through to the container
+_ENV_OPTS = tuple(
+    opt
+    for var in (
+        "DEBUG",
+        "MQTT_SERVER_HOSTNAME",
+        "MQTT_SERVER_PORT",
+        "MQTT_SERVER_USERNAME",
+        "MQTT_SERVER_PASSWORD",
+    )
+    for opt in ("-e", var)
+)
+
 
+async def _docker_run(opts: Opts, cfg: FlatConfig):
     cmd = [*opts.docker_cli, "kill", "-s", "15", cfg.deployment_container_name]
     await _print_or_exec(opts, *cmd, stderr=DEVNULL, raise_on_error=False)
 
@@ -268,17 +299,6 @@ async def _docker_run(opts: Opts, cfg: FlatConfig):
 
     bind_opts = [f"--volume={host_cfg_path}:{container_cfg_path}"]
     device_opts = [f"--device={dev}" for dev in glob("/dev/gpiochip*")]
-    security_opts = ["--security-opt", "label=disable"]  # Fedora IoT SELinux
-    env_opts = chain.from_iterable(
-        ("-e", var)
-        for var in (
-            "DEBUG",
-            "MQTT_SERVER_HOSTNAME",
-            "MQTT_SERVER_PORT",
-            "MQTT_SERVER_USERNAME",
-            "MQTT_SERVER_PASSWORD",
-        )
-    )
     cmd = [
         *opts.docker_cli,
         "run",
@@ -286,14 +306,24 @@ async def _docker_run(opts: Opts, cfg: FlatConfig):
         "--init",
         *bind_opts,
         *device_opts,
-        *security_opts,
-        *env_opts,
+        *_SECURITY_OPTS,
+        *_ENV_OPTS,
         *entrypoint,
         "--name",
         cfg.deployment_container_name,
         opts.image,
         *dockerfile_cmd,
     ]
+    if opts.dockerfile_command and not opts.print_command_lines and os.name == "posix":
+        # Interactive usage: There is nothing left to do after the container
+        # exits, so replace this process with the docker CLI rather than keep
+        # the Python interpreter around as its parent. The exit code of the
+        # docker CLI becomes the exit code of this script.
+        _logger.info("+ %s", " ".join(cmd))
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.execvp(cmd[0], cmd)
+
     await _print_or_exec(opts, *cmd)
 
     if not opts.print_command_lines and not opts.dockerfile_command:
@@ -362,13 +392,7 @@ def _parse_host_os_data(host_os_data: list[str] | None) -> HostOSData:
             "It must be an even number of space-separated key-value pairs."
         )
 
-    from collections.abc import Iterable
-    from itertools import batched
-    from typing import cast
-
-    data_dict: dict[str, str] = dict(
-        cast(Iterable[tuple[str, str]], batched(host_os_data, n=2))
-    )
+    data_dict = dict(zip(host_os_data[::2], host_os_data[1::2], strict=True))
     try:
         return HostOSData(**data_dict)
     except TypeError as e:
@@ -381,20 +405,28 @@ async def _select_image_name(docker_cmd: list[str]) -> str:
     Preference is given to a locally built ‘oh_so_smart’ image if present,
     otherwise ‘ghcr.io/pdcastro/oh_so_smart’.
     """
-    out, _err, _exit_code = await communicate(
-        *docker_cmd, "images", "--format", "{{.Repository}}:{{.Tag}}"
+    agen = aexec(
+        *docker_cmd, "images", "--format", "{{.Repository}}:{{.Tag}}", stdout=PIPE
     )
+    proc = cast(Process, await anext(agen))
     selected = f"{REGISTRY_IMAGE_NAME}:latest"
+    local_latest = f"{LOCAL_IMAGE_NAME}:latest"
     # ‘podman’ lists local images with a ‘localhost/’ prefix.
-    local_latest: list[bytes] = [
-        f"{LOCAL_IMAGE_NAME}:latest".encode(),
-        f"localhost/{LOCAL_IMAGE_NAME}:latest".encode(),
-    ]
-    # ‘out’ and ‘line’ are of type ‘bytes’ (not ‘str’).
-    for line in out.split(b"\n"):
-        if line.strip() in local_latest:
-            selected = local_latest[0].decode()
+    candidates = frozenset(
+        (local_latest.encode(), f"localhost/{local_latest}".encode())
+    )
+    # Stream the image list and stop reading (and the subprocess) at the
+    # first match. ‘line’ is of type ‘bytes’ (not ‘str’).
+    async for line in cast(asyncio.StreamReader, proc.stdout):
+        if line.rstrip() in candidates:
+            selected = local_latest
+            with suppress(ProcessLookupError):
+                proc.terminate()
+            await proc.wait()
+            await agen.aclose()
             break
+    else:
+        await anext(agen)  # Raises SubprocessError on a non-zero exit code
 
     _logger.info("Selected image name ‘%s’", selected)
     return selected
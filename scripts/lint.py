@@ -18,7 +18,11 @@ import os.path
 import shutil
 import sys
 import textwrap
+from asyncio.subprocess import STDOUT
+from collections.abc import Sequence
+from contextvars import ContextVar
 from dataclasses import dataclass
+from functools import lru_cache
 from glob import glob
 from typing import Final, Literal
 
@@ -47,11 +51,17 @@ AVAILABLE_TOOLS = [
     "check-uncommitted",
 ]
 
+# Tools that only read the source tree and can therefore run concurrently,
+# ahead of ‘ruff-format’ (which rewrites files) and ‘check-uncommitted’.
+CONCURRENT_TOOLS: Final = frozenset(("ruff-check", "pylint", "pyright", "shellcheck"))
+
 
 @dataclass
 class Opts:
     # Formatter and linter tools selected on the command line.
     tools: list[str]
+    # Maximum number of tools to run concurrently.
+    jobs: int
 
     def __post_init__(self):
         """Validate and rewrite the command line options."""
@@ -69,6 +79,8 @@ class Opts:
 
         # Preserve the listing order of tools in ‘available_tools’
         self.tools = [tool for tool in AVAILABLE_TOOLS if tool in selected_set]
+        if self.jobs < 1:
+            raise CommandLineError(f"Invalid number of jobs: {self.jobs}")
 
 
 class ToolNotFound(Exception):
@@ -84,6 +96,7 @@ PIP_INSTALL_INSTRUCTIONS: Final = textwrap.dedent(
 )
 
 
+@lru_cache
 def _check_which(tool: str, install_instructions=PIP_INSTALL_INSTRUCTIONS) -> str:
     for prefix in (["venv", "bin"], ["env", "bin"], []):
         if path := shutil.which(os.path.join(*prefix, tool)):
@@ -92,6 +105,45 @@ def _check_which(tool: str, install_instructions=PIP_INSTALL_INSTRUCTIONS) -> st
     raise ToolNotFound(f"‘{tool}’ not found. {install_instructions}")
 
 
+# Command lines and output of the subprocesses of a tool, captured when the
+# tool runs concurrently with other tools so that their output does not interleave.
+CapturedOutputT = list[tuple[Sequence[str], bytes]]
+_captured_output: ContextVar[CapturedOutputT | None] = ContextVar(
+    "_captured_output", default=None
+)
+
+
+async def _exec(*args: str, raise_on_error=True) -> int:
+    """Run a tool subprocess with wait_exec(), or capture its output."""
+    captured = _captured_output.get()
+    if captured is None:
+        return await wait_exec(*args, raise_on_error=raise_on_error)
+    try:
+        out, _err, exit_code = await communicate(
+            *args, log=None, raise_on_error=raise_on_error, stderr=STDOUT
+        )
+    except SubprocessError as e:
+        captured.append((args, e.stdout))
+        # Printed by _print_captured(), so not repeated in the error message
+        e.stdout = b""
+        raise
+    captured.append((args, out))
+    return exit_code
+
+
+def _print_captured(captured: CapturedOutputT):
+    for args, out in captured:
+        _logger.info("+" + " %s" * len(args), *args)
+        sys.stdout.write(out.decode(errors="replace"))
+        sys.stdout.flush()
+
+
+@lru_cache
+def _python_sources() -> tuple[str, ...]:
+    """Python source file arguments shared by ruff, pylint and pyright."""
+    return ("oh_so_smart", *glob(os.path.join("scripts", "*.py")))
+
+
 def _print_header(tool: str):
     print()
     msg = "\n".join(["", "-" * 70, f"Running {tool}...", "-" * 70])
@@ -100,12 +152,11 @@ def _print_header(tool: str):
 
 async def _run_ruff(subcommand: Literal["check", "format"]):
     ruff = _check_which("ruff")
-    await wait_exec(ruff, "--version")
-    await wait_exec(
+    await _exec(ruff, "--version")
+    await _exec(
         ruff,
         subcommand,
-        "oh_so_smart",
-        *glob(os.path.join("scripts", "*.py")),
+        *_python_sources(),
     )
 
 
@@ -119,14 +170,13 @@ async def _run_ruff_format():
 
 async def _run_pylint():
     pylint = _check_which("pylint")
-    await wait_exec(pylint, "--version")
-    await wait_exec(
+    await _exec(pylint, "--version")
+    await _exec(
         pylint,
         "--load-plugins",
         "pylint_pydantic",
         "-v",
-        "oh_so_smart",
-        *glob(os.path.join("scripts", "*.py")),
+        *_python_sources(),
     )
 
 
@@ -141,23 +191,19 @@ async def _run_pyright():
                 "$ npm install -g pyright",
             )
         ]
-        await wait_exec(*cmd, "--version")
+        await _exec(*cmd, "--version")
     except ToolNotFound:
         npx = shutil.which("npx")
-        if (
-            npx
-            and await wait_exec(npx, pyright, "--version", raise_on_error=False) == 0
-        ):
+        if npx and await _exec(npx, pyright, "--version", raise_on_error=False) == 0:
             cmd = [npx, pyright]
         else:
             raise
 
-    await wait_exec(
+    await _exec(
         *cmd,
         "--pythonpath",
         python,
-        "oh_so_smart",
-        *glob(os.path.join("scripts", "*.py")),
+        *_python_sources(),
     )
 
 
@@ -167,8 +213,8 @@ async def _run_shellcheck():
         install_instructions="Installation instructions:\n"
         "https://github.com/koalaman/shellcheck?tab=readme-ov-file#installing",
     )
-    await wait_exec(shellcheck, "--version")
-    await wait_exec(
+    await _exec(shellcheck, "--version")
+    await _exec(
         shellcheck,
         *glob(os.path.join("scripts", "*.sh")),
     )
@@ -180,9 +226,9 @@ async def _run_check_uncommitted():
         install_instructions="Installation instructions:\n"
         "https://git-scm.com/downloads",
     )
-    await wait_exec(git, "--version")
+    await _exec(git, "--version")
     out, _err, _code = await communicate(git, "status", "--porcelain")
-    out = out.decode()
+    # ‘out’ is only decoded to format the error message.
     if out.strip():
         msg = textwrap.dedent(
             """\
@@ -190,23 +236,58 @@ async def _run_check_uncommitted():
             {}
             This is usually caused by ‘black’ reformatting the source code.
             Please run ./scripts/lint.py on your machine and commit any changes."""
-        ).format(out.rstrip())
+        ).format(out.decode().rstrip())
         raise ValidationError(msg)
 
 
+async def _run_tool(tool: str) -> Exception | None:
+    try:
+        await globals()[f"_run_{tool.replace('-', '_')}"]()
+    except (OSError, SubprocessError, ToolNotFound, ValidationError) as e:
+        # Expected tool failures, reported by _check_result(). Other exceptions
+        # are bugs and propagate.
+        return e
+    return None
+
+
+async def _run_captured(
+    tool: str, semaphore: asyncio.Semaphore
+) -> tuple[CapturedOutputT, Exception | None]:
+    # Each gather() task runs in a copy of the context, so this is task-local.
+    captured: CapturedOutputT = []
+    _captured_output.set(captured)
+    async with semaphore:
+        return captured, await _run_tool(tool)
+
+
+def _check_result(tool: str, error: Exception | None):
+    if error is None:
+        _logger.info("\n✅ PASS")
+        return
+    _logger.info("\n❌ FAIL")
+    _logger.error("FAILED to run ‘%s’ tool.", tool)
+    raise error
+
+
 async def _run_subcommand(opts: Opts):
     os.chdir(DEFAULT_PROJECT_DIR)
 
     tools = opts.tools
+    concurrent = [tool for tool in tools if tool in CONCURRENT_TOOLS]
+    if opts.jobs > 1 and len(concurrent) > 1:
+        semaphore = asyncio.Semaphore(opts.jobs)
+        results = await asyncio.gather(
+            *(_run_captured(tool, semaphore) for tool in concurrent)
+        )
+        for tool, (captured, error) in zip(concurrent, results):
+            _print_header(tool)
+            _print_captured(captured)
+            _check_result(tool, error)
+        tools = [tool for tool in tools if tool not in CONCURRENT_TOOLS]
+
     for tool in tools:
         _print_header(tool)
-        try:
-            await globals()[f"_run_{tool.replace('-', '_')}"]()
-            _logger.info("\n✅ PASS")
-        except Exception as e:
-            _logger.info("\n❌ FAIL")
-            _logger.error("FAILED to run ‘%s’ tool.", tool)
-            raise e
+        _check_result(tool, await _run_tool(tool))
 
 
 def _parse_cmd_line():
@@ -239,11 +320,22 @@ def _parse_cmd_line():
             If no arguments are provided, the default is to run all tools except
             for ‘check-uncommitted’. ‘all’ is shorthand for all tools, including
             ‘check-uncommitted’. Tools are run in the order listed above, even
-            if they are provided in a different order on the command line.""".format(
+            if they are provided in a different order on the command line,
+            except that the linters that do not modify files (ruff-check,
+            pylint, pyright and shellcheck) run concurrently ahead of the
+            others. Their output is printed in the order listed above.""".format(
                 " ".join(AVAILABLE_TOOLS)
             ),
         ),
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Maximum number of tools to run concurrently. Use 1 to run the\n"
+        "tools one at a time, with live output. Default: number of CPUs.",
+    )
     return Opts(**vars(parser.parse_args()))
 
 
@@ -30,38 +30,58 @@ def delete_incompatible_binaries(site_pkg_dir: str):
     if sys.platform.startswith("linux"):
         return
 
-    from glob import glob
-    from os import unlink
-
-    files = glob(f"{site_pkg_dir}/gpiod/*.so")
+    try:
+        with os.scandir(join(site_pkg_dir, "gpiod")) as entries:
+            files = [
+                e.path
+                for e in entries
+                if e.name.endswith(".so") and e.is_file(follow_symlinks=False)
+            ]
+    except FileNotFoundError:
+        return
     if 0 < len(files) < 3:
         for file in files:
             _logger.info("Deleting incompatible binary extension file '%s'", file)
-            unlink(file)
+            os.unlink(file)
 
 
-async def copy_gpiod_from_docker_container(gpiod_pkg_spec: str):
+def get_docker_image() -> str:
+    """Python Docker image matching this interpreter, e.g. 'python:3.12.4-bookworm'."""
+    v = sys.version_info
+    return f"python:{v.major}.{v.minor}.{v.micro}-bookworm"
+
+
+async def copy_gpiod_from_docker_container(gpiod_pkg_spec: str, docker_img: str):
     """Run "pip install gpiod" in a temp Linux container and copy the install dir.
 
+    Rather than bind-mounting the local site-packages directory (slow on macOS
+    and Windows for gpiod's many small files), pip installs gpiod into a target
+    directory inside the container, which is then copied out with ‘docker cp’
+    as a single tar stream.
+
     Args:
         gpiod_pkg_spec (str): Package spec from requirements.txt, e.g. 'gpiod~=2.2'
+        docker_img (str): Previously pulled image name, see get_docker_image()
     """
 
     v = sys.version_info
     ver2 = f"{v.major}.{v.minor}"  # E.g. '3.12'
-    ver3 = f"{v.major}.{v.minor}.{v.micro}"  # E.g. '3.12.4'
-    docker_img = f"python:{ver3}-bookworm"
     site_pkg_dir = join(get_venv_dir(), *["lib", f"python{ver2}", "site-packages"])
-    bind_dir = "/out-site-packages"
+    target_dir = "/out-site-packages"
+    container = f"pip_install_gpiod_{os.getpid()}"
     # fmt: off
     cmd = [
-        "docker", "run", "--rm", "-v", f"{site_pkg_dir}:{bind_dir}",
-        "--pull", "always", docker_img, "sh", "-c",
-        f"pip install '{gpiod_pkg_spec}' 1>&2 && cp -av "
-        f"'/usr/local/lib/python{ver2}/site-packages/'gpiod* '{bind_dir}/'",
+        "docker", "run", f"--name={container}", docker_img,
+        "pip", "install", f"--target={target_dir}", gpiod_pkg_spec,
     ]
     # fmt: on
-    await wait_exec(*cmd, stdin=DEVNULL)
+    try:
+        await wait_exec(*cmd, stdin=DEVNULL)
+        await wait_exec("docker", "cp", f"{container}:{target_dir}/.", site_pkg_dir)
+    finally:
+        await wait_exec(
+            "docker", "rm", "-f", container, stdout=DEVNULL, raise_on_error=False
+        )
     delete_incompatible_binaries(site_pkg_dir)
 
 
@@ -71,16 +91,14 @@ def filter_requirements() -> tuple[list[str], str]:
     req_file = join(get_project_dir(), "requirements.txt")
 
     with open(req_file, "rt", encoding="utf-8") as req:
-        lines = req.readlines()
-
-    for line in lines:
-        pkg = line.strip()
-        if not pkg or pkg.startswith("--"):
-            continue
-        if pkg.startswith("gpiod"):
-            gpiod_pkg = pkg
-        else:
-            packages.append(pkg)
+        for line in req:
+            pkg = line.strip()
+            if not pkg or pkg.startswith("--"):
+                continue
+            if pkg.startswith("gpiod"):
+                gpiod_pkg = pkg
+            else:
+                packages.append(pkg)
 
     return packages, gpiod_pkg
 
@@ -89,20 +107,16 @@ async def pip_install_local(packages: list[str]):
     """pip install -U -r <pkg1, pkg2...> -r requirements_dev.txt"""
     venv_dir = get_venv_dir()
     project_dir = get_project_dir()
-    previous_dir = os.getcwd()
-    os.chdir(project_dir)
-    try:
-        await wait_exec(
-            join(".", f"{venv_dir}", "bin", "pip"),
-            "install",
-            "-U",
-            *packages,
-            "-r",
-            join(get_project_dir(), "requirements_dev.txt"),
-            stdin=DEVNULL,
-        )
-    finally:
-        os.chdir(previous_dir)
+    await wait_exec(
+        join(venv_dir, "bin", "pip"),
+        "install",
+        "-U",
+        *packages,
+        "-r",
+        join(project_dir, "requirements_dev.txt"),
+        cwd=project_dir,
+        stdin=DEVNULL,
+    )
 
 
 @lru_cache
@@ -155,8 +169,8 @@ def _parse_cmd_line():
               - <venv> is a local Python virtual environment directory at the project’s root.
               - <packages> is the list of dependencies other than gpiod.
             - Run ‘pip install gpiod~=X.Y’ in a temporary Linux Docker container, and copy
-              the ‘.../site-packages/gpiod/*’ files from the container to the local virtual
-              environment (by means of a directory bind mount: ‘docker run -v’ option).
+              the installed ‘gpiod’ files from the container to the local virtual
+              environment’s ‘site-packages’ directory (by means of ‘docker cp’).
             """
         ),
         formatter_class=argparse.RawTextHelpFormatter,
@@ -173,9 +187,16 @@ async def main():
         _parse_cmd_line()
         await ensure_venv()
         packages, gpiod_pkg = filter_requirements()
-        await pip_install_local(packages)
+        docker_img = get_docker_image()
+        # The local pip install and the Docker image pull are independent and
+        # network bound, so run them concurrently. ‘docker pull -q’ avoids
+        # interleaving its progress bars with pip’s output.
+        await asyncio.gather(
+            pip_install_local(packages),
+            wait_exec("docker", "pull", "-q", docker_img, stdin=DEVNULL),
+        )
         print()
-        await copy_gpiod_from_docker_container(gpiod_pkg)
+        await copy_gpiod_from_docker_container(gpiod_pkg, docker_img)
     except Exception as e:  # pylint: disable=broad-exception-caught
         _logger.error(e)
         exit_code = 1
@@ -26,6 +26,7 @@ import os
 import re
 import sys
 import textwrap
+from asyncio.subprocess import STDOUT
 from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Final, Literal
@@ -67,6 +68,19 @@ class Opts:
     # main_release: bool  # ‘main’ branch release
 
 
+# Match Dockerfile lines such as:
+# FROM python:3.13-bookworm AS build
+# FROM python:3.13-slim-bookworm
+_FROM_PATTERN: Final = re.compile(
+    r"^\s*FROM\s+(\S+\s+)*?(?P<img>\S+)(\s+AS\s+\S+)?\s*$",
+    re.ASCII | re.IGNORECASE,
+)
+# Base image tag after the Python version, see _get_base_tag()
+_BASE_TAG_PATTERN: Final = re.compile(r"(?ai)\S+?:[0-9.-]*(?P<tag>\S+)")
+# Replace characters not allowed in image tag name components, see _get_branch_tag()
+_TAG_CHAR_TRANS: Final = str.maketrans(":.-", "___")
+
+
 def _get_base_tag(dockerfile_path: str) -> str:
     """Extract part of the base image tag in the last ‘FROM’ line of the given Dockerfile.
 
@@ -74,22 +88,15 @@ def _get_base_tag(dockerfile_path: str) -> str:
         str: E.g. ‘slim-bookworm’ given ‘FROM python:3.13-slim-bookworm’, or
             ‘alpine3.21’ given ‘FROM python:3.13-alpine3.21’.
     """
-    # Match lines such as:
-    # FROM python:3.13-bookworm AS build
-    # FROM python:3.13-slim-bookworm
-    from_pattern = re.compile(
-        r"^\s*FROM\s+(\S+\s+)*?(?P<img>\S+)(\s+AS\s+\S+)?\s*$",
-        re.ASCII | re.IGNORECASE,
-    )
     base_image = ""  # E.g. ‘python:3.13-slim-bookworm’
     with open(dockerfile_path, encoding="utf-8") as f:
         for line in f:
-            if m := from_pattern.fullmatch(line):
+            if m := _FROM_PATTERN.fullmatch(line):
                 # Do not ‘break’ here because we want the last ‘FROM’ line
                 base_image = m.groupdict()["img"]
 
     # E.g. extract ‘slim-bookworm’ from ‘python:3.13-slim-bookworm’
-    m = re.fullmatch(r"(?ai)\S+?:[0-9.-]*(?P<tag>\S+)", base_image)
+    m = _BASE_TAG_PATTERN.fullmatch(base_image)
     try:
         return m.groupdict()["tag"]  # pyright: ignore[reportOptionalMemberAccess]
     except (AttributeError, KeyError) as e:
@@ -126,7 +133,7 @@ def _get_branch_tag() -> str:
     else:
         name = "dev"
 
-    name = name.translate(str.maketrans(":.-", "___"))
+    name = name.translate(_TAG_CHAR_TRANS)
     return f"{name}.{GITHUB_SHA[:8]}"
 
 
@@ -164,7 +171,10 @@ async def _setup_python_semantic_release():
     """
     await wait_exec("python", "-m", "venv", PSR_VENV_DIR)
     await wait_exec(
-        f"./{PSR_VENV_DIR}/bin/pip", "install", "-r", "requirements_psr.txt"
+        f"./{PSR_VENV_DIR}/bin/pip",
+        "install",
+        "--disable-pip-version-check",
+        *["-r", "requirements_psr.txt"],
     )
 
 
@@ -275,10 +285,10 @@ async def _delete_images(account: str, img_name: str, img_tags: Iterable[str]):
     )
 
 
-async def _build_docker_image(
+def _build_docker_image_cmd(
     python_distro: Literal["alpine", "debian"], nametag: str, publish: bool
-):
-    await wait_exec(
+) -> list[str]:
+    return [
         "./scripts/docker.py",
         *["--config-file", "sample_config/smart_thermostat.toml"],
         *["--docker-platforms", "amd64", "arm64", "arm/v7"],
@@ -286,7 +296,45 @@ async def _build_docker_image(
         *["--image", nametag],
         "build",
         *(["--publish"] if publish else []),
+    ]
+
+
+async def _build_docker_image(
+    python_distro: Literal["alpine", "debian"], nametag: str, publish: bool
+):
+    await wait_exec(*_build_docker_image_cmd(python_distro, nametag, publish))
+
+
+async def _build_docker_images_concurrently(
+    nametags_by_distro: dict[Literal["alpine", "debian"], str],
+):
+    """Build (publish=False) the given images concurrently.
+
+    The output of each build is captured and printed once all builds have
+    finished, so that the logs of different builds are not interleaved.
+
+    Raises:
+        SubprocessError: If any of the builds fail.
+    """
+
+    async def build(distro: Literal["alpine", "debian"], nametag: str):
+        _logger.info("Building (publish=False) image '%s'", nametag)
+        cmd = _build_docker_image_cmd(distro, nametag, publish=False)
+        return await communicate(*cmd, raise_on_error=False, stderr=STDOUT)
+
+    results = await asyncio.gather(
+        *(build(distro, nametag) for distro, nametag in nametags_by_distro.items())
     )
+    for nametag, (out, _err, _exit_code) in zip(nametags_by_distro.values(), results):
+        _logger.info("Output of the build of image '%s':", nametag)
+        sys.stdout.write(out.decode(errors="replace"))
+        sys.stdout.flush()
+    for nametag, (_out, _err, exit_code) in zip(nametags_by_distro.values(), results):
+        if exit_code:
+            raise SubprocessError(
+                f"Failed to build image '{nametag}' (exit code ‘{exit_code}’)",
+                exit_code=exit_code,
+            )
 
 
 async def _publish_docker_images(version_tag: str):
@@ -298,12 +346,14 @@ async def _publish_docker_images(version_tag: str):
         distro: f"{img_name}:{tag}" for distro, tag in img_tags.items()
     }
 
-    # First build all Docker images. If all the builds succeed, then publish
-    # them to the registry.
-    for distro in ("debian", "alpine"):
-        registry_nametag = f"{registry}/{account}/{nametags_by_distro[distro]}"
-        _logger.info("Building (publish=False) image '%s'", registry_nametag)
-        await _build_docker_image(distro, registry_nametag, publish=False)
+    # First build all Docker images, concurrently as they are independent.
+    # If all the builds succeed, then publish them to the registry.
+    await _build_docker_images_concurrently(
+        {
+            distro: f"{registry}/{account}/{nametags_by_distro[distro]}"
+            for distro in ("debian", "alpine")
+        }
+    )
 
     # Avoid leaving orphan images in the registry in the exceptional event that
     # the release process fails (before a GitHub repo release is created) and
@@ -328,14 +378,24 @@ async def _publish_docker_images(version_tag: str):
         await asyncio.sleep(1)
 
     # If all of the above succeeded and the build is for the main branch,
-    # additionally tag one of the images as ":latest" and push it too.
+    # additionally tag one of the images as ":latest" and push it too. The
+    # ‘imagetools create’ command copies the published image index within the
+    # registry, including its annotations, without pushing anything from the
+    # local image store.
     if _is_main_branch():
         # ‘ghcr.io/pdcastro/oh_so_smart:latest’
         latest = f"{registry}/{account}/{img_name}:latest"
         registry_nametag = f"{registry}/{account}/{nametags_by_distro['alpine']}"
-        _logger.info("Tagging and pushing image '%s'", latest)
-        await wait_exec("docker", "tag", registry_nametag, latest)
-        await wait_exec("docker", "push", latest)
+        _logger.info("Tagging image '%s' in the registry", latest)
+        await wait_exec(
+            "docker",
+            "buildx",
+            "imagetools",
+            "create",
+            "--tag",
+            latest,
+            registry_nametag,
+        )
 
     _logger.info("Image building finished")
 
@@ -19,11 +19,15 @@ import ntpath
 import os
 import posixpath
 import sys
+import tempfile
 import textwrap
+from collections.abc import Iterator
 from dataclasses import dataclass
+from functools import lru_cache
 from os.path import abspath, join, normpath
 from shlex import quote
-from shutil import which
+from shutil import rmtree, which
+from typing import Final
 
 from common import (
     CommandLineError,
@@ -46,6 +50,50 @@ from config import (
 
 _logger = logging.getLogger(__name__)
 
+# The ssh control socket path while a control master started by
+# _start_ssh_master() is running, otherwise None.
+_ssh_control_path: str | None = None  # pylint: disable=invalid-name
+
+# Maximum number of concurrent scp transfers. Multiplexed over the ssh control
+# master, each transfer is a session counted against sshd’s ‘MaxSessions’
+# limit (10 by default).
+_MAX_SCP_SESSIONS: Final = 8
+
+# Directory and file names not transferred by ‘upload.py --all’
+_SCP_EXCLUDE_DIRS: Final = frozenset({"__pycache__", "manage-packages"})
+_SCP_EXCLUDE_FILES: Final = frozenset({"release.py", "manage-packages.mjs"})
+
+# Remote shell command substitution for ‘docker’ or compatible container engine
+_REMOTE_ENGINE: Final = (
+    '"$(command -v docker || command -v podman || command -v balena-engine'
+    ' || echo docker)"'
+)
+
+# rsync ‘--exclude’ options for ‘upload.py --container’
+_RSYNC_EXCLUDE_ARGS: Final = tuple(
+    f"--exclude={pattern}"
+    for pattern in (
+        ".DS_Store",
+        ".git",
+        "data",
+        "env",
+        "venv",
+        ".venv",
+        "img",
+        "unused",
+        "__pycache__",
+        "*.pyc",
+        "*.egg-info",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".python-version",
+        ".vscode",
+        "node_modules",
+        "site-packages",
+    )
+)
+
 
 @dataclass
 class Opts:
@@ -89,25 +137,92 @@ def _check_rsync():
     raise FileNotFoundError("\n".join(msg))
 
 
+@lru_cache
+def _which(cmd: str) -> str:
+    """Cached ‘shutil.which(cmd)’, falling back to ‘cmd’ if not found in PATH."""
+    return which(cmd) or cmd
+
+
+def _ssh_cmd(tool="ssh") -> list[str]:
+    """Return the ‘ssh’ or ‘scp’ command prefix, with connection multiplexing
+    options if a control master was started by _start_ssh_master().
+    """
+    cmd = [_which(tool)]
+    if _ssh_control_path:
+        cmd += ["-o", f"ControlPath={_ssh_control_path}", "-o", "ControlMaster=auto"]
+    return cmd
+
+
+async def _start_ssh_master(cfg: FlatConfig) -> str | None:
+    """Start an ssh control master connection to the target device.
+
+    Subsequent ssh, scp and rsync invocations reuse the master’s TCP connection
+    and authenticated session, skipping the per-connection handshake. Not
+    supported by the Windows port of OpenSSH.
+
+    Returns:
+        str | None: The temporary directory holding the control socket, to be
+        passed to _stop_ssh_master(), or None if multiplexing is not supported.
+    """
+    global _ssh_control_path
+    if os.name != "posix":
+        return None
+    # Short socket path: Unix domain socket paths are limited to ~104 chars.
+    control_dir = tempfile.mkdtemp(prefix="oss-ssh-")
+    control_path = join(control_dir, "ctl")
+    try:
+        # ‘-f’ forks ssh to the background after authentication, and
+        # ‘ControlPersist’ bounds its lifetime should _stop_ssh_master()
+        # never be called, e.g. if this script is killed.
+        await wait_exec(
+            _which("ssh"),
+            *("-f", "-N", "-M", "-o", f"ControlPath={control_path}"),
+            *("-o", "ControlPersist=60s", cfg.deployment_ssh_host_name),
+        )
+    except BaseException:
+        rmtree(control_dir, ignore_errors=True)
+        raise
+    _ssh_control_path = control_path
+    return control_dir
+
+
+async def _stop_ssh_master(cfg: FlatConfig, control_dir: str | None):
+    """Stop the control master started by _start_ssh_master(), if any."""
+    global _ssh_control_path
+    if control_dir is None or _ssh_control_path is None:
+        return
+    control_path, _ssh_control_path = _ssh_control_path, None
+    try:
+        await wait_exec(
+            _which("ssh"),
+            *("-o", f"ControlPath={control_path}", "-O", "exit"),
+            cfg.deployment_ssh_host_name,
+            log=_logger.debug,
+            raise_on_error=False,
+        )
+    finally:
+        rmtree(control_dir, ignore_errors=True)
+
+
 def _filter_walk(
-    root: str, rel_to: str, exclude_dirs: set[str], exclude_files: set[str]
-) -> dict[str, list[str]]:
+    root: str, rel_to: str, exclude_dirs: frozenset[str], exclude_files: frozenset[str]
+) -> Iterator[tuple[str, list[str]]]:
     """‘os.walk(root)’ filtering out selected directories and files.
 
     Args:
         root (str): Root directory for ‘os.walk(root)’.
-        rel_to (str): Directory to which paths are made relative in the returned
-            dict. Must be a prefix (substring at the beginning) of ‘root’.
-        exclude_dirs (set[str]): Set of directory names to exclude from ‘os.walk()’.
-        exclude_files (set[str]): Set of file names to exclude from ‘os.walk()’.
+        rel_to (str): Directory to which directory paths are made relative in
+            the yielded tuples. Must be a prefix (substring at the beginning) of ‘root’.
+        exclude_dirs (frozenset[str]): Directory names to exclude from ‘os.walk()’.
+        exclude_files (frozenset[str]): File names to exclude from ‘os.walk()’.
 
     Raises:
         Exception: If ‘rel_to’ is not a parent directory or the same directory
         as ‘root’.
 
-    Returns:
-        dict[str, list[str]]: Keys are the visited directory paths relative to
-        ‘rel_to’, and values are the relative paths of each file in that directory.
+    Yields:
+        tuple[str, list[str]]: Each visited directory path relative to ‘rel_to’,
+        and the paths of each file in that directory, prefixed with ‘root’.
     """
     root = _slashed(normpath(root))
     rel_to = _slashed(normpath(rel_to))
@@ -118,25 +233,23 @@ def _filter_walk(
             f"rel_to: ‘{rel_to}’"
         )
 
-    result: dict[str, list[str]] = {}
     rel_len = len(rel_to)
     for directory, directories, files in os.walk(root):
-        directories[:] = set(directories) - exclude_dirs
-        files[:] = set(files) - exclude_files
-        rel_dir = directory[rel_len:]
-        result[rel_dir] = [join(rel_dir, f) for f in files]
-
-    return result
+        # Pruning ‘directories’ in place stops os.walk() descending into them
+        directories[:] = [d for d in directories if d not in exclude_dirs]
+        yield (
+            directory[rel_len:],
+            [join(directory, f) for f in files if f not in exclude_files],
+        )
 
 
 # Check whether the app container is running on the target device
 async def _is_container_running(cfg: FlatConfig):
     remote_cmd = (
-        '"$(command -v docker || command -v podman || command -v balena-engine || echo docker)"'
-        " container inspect --format '{{.State.Running}}' "
+        f"{_REMOTE_ENGINE} container inspect --format '{{{{.State.Running}}}}' "
         f"{cfg.deployment_container_name}"
     )
-    args = [which("ssh") or "ssh", cfg.deployment_ssh_host_name, remote_cmd]
+    args = [*_ssh_cmd(), cfg.deployment_ssh_host_name, remote_cmd]
     out, err, code = await communicate(*args, raise_on_error=False)
     out = out.strip().lower()
     is_running = code == 0 and out == b"true"
@@ -152,22 +265,28 @@ async def _is_container_running(cfg: FlatConfig):
 
 
 async def _rsync_to_container(opts: Opts, cfg: FlatConfig):
-    """Upload project files to a running Docker container."""
+    """Upload project files to a running Docker container.
 
-    exclude = ".DS_Store .git data env venv img unused __pycache__ \
-        *.pyc .mypy_cache .python-version .vscode site-packages"
-    rsh_cmd = (
-        f"'{quote(sys.executable)}' '{quote(abspath(__file__))}' "
-        f"--rsh '{quote(cfg.deployment_container_name)}'"
+    rsync runs ‘ssh <host> <rsync-path> --server ...’, and the remote shell
+    expands the ‘--rsync-path’ setting into a ‘docker exec’ command line that
+    runs rsync in the container. The container therefore needs ‘rsync’, but
+    not an ssh client or server.
+    """
+    rsync_path = (
+        f"{_REMOTE_ENGINE} exec -i {quote(cfg.deployment_container_name)} rsync"
     )
     await wait_exec(
-        which("rsync") or "rsync",
+        _which("rsync"),
         "-rlptDv",
+        # Send whole files: delta transfer would cost checksum round trips
+        # through ‘docker exec’ for small source files. Compress the data
+        # stream: rsync >= 3.2 negotiates the best algorithm, e.g. zstd.
+        "-Wz",
         "--mkpath",
         *(["--delete"] if opts.delete else []),
-        *(f"--exclude={pattern}" for pattern in exclude.split()),
-        "--rsh",
-        rsh_cmd,
+        *_RSYNC_EXCLUDE_ARGS,
+        f"--rsh={' '.join(quote(arg) for arg in _ssh_cmd())}",
+        f"--rsync-path={rsync_path}",
         _slashed(opts.local_project_dir),
         _slashed(f"{cfg.deployment_ssh_host_name}:{APP_CONTAINER_PROJECT_DIR}"),
     )
@@ -214,9 +333,9 @@ async def _scp_to_host_os(opts: Opts, cfg: FlatConfig):
         for directory, files in _filter_walk(
             join(opts.local_project_dir, src_dir),
             rel_to=opts.local_project_dir,
-            exclude_dirs={"__pycache__", "manage-packages"},
-            exclude_files={"release.py", "manage-packages.mjs"},
-        ).items():
+            exclude_dirs=_SCP_EXCLUDE_DIRS,
+            exclude_files=_SCP_EXCLUDE_FILES,
+        ):
             transfers.append(Transfer(sources=files, dest=directory, mode=mode))
 
     if opts.all:
@@ -250,10 +369,9 @@ async def _scp_to_host_os(opts: Opts, cfg: FlatConfig):
         )
     # Gather all destination directories as arguments for ‘mkdir -p’
     host_dir = cfg.deployment_host_os_project_dir
-    dest_dirs = " ".join(sorted(set(_posijoin(host_dir, tr.dest) for tr in transfers)))
-    await wait_exec(
-        which("ssh") or "ssh", cfg.deployment_ssh_host_name, f"mkdir -p {dest_dirs}"
-    )
+    remote_dirs = {tr.dest: _posijoin(host_dir, tr.dest) for tr in transfers}
+    dest_dirs = " ".join(sorted(set(remote_dirs.values())))
+    await wait_exec(*_ssh_cmd(), cfg.deployment_ssh_host_name, f"mkdir -p {dest_dirs}")
     scp_opts = "-r"
     is_unix = os.name == "posix"  # Includes Linux and macOS, of particular interest.
     if is_unix:
@@ -263,57 +381,43 @@ async def _scp_to_host_os(opts: Opts, cfg: FlatConfig):
 
     tasks: list[Coroutine[Any, Any, int]] = [
         wait_exec(
-            which("scp") or "scp",
+            *_ssh_cmd("scp"),
             scp_opts,
             *(join(opts.local_project_dir, s) for s in tr.sources),
-            f"{cfg.deployment_ssh_host_name}:{_posijoin(host_dir, tr.dest)}",
+            f"{cfg.deployment_ssh_host_name}:{remote_dirs[tr.dest]}",
         )
         for tr in transfers
     ]
-    await max_gather(4, *tasks)
+    await max_gather(_MAX_SCP_SESSIONS, *tasks)
 
     if not is_unix:
         # Fix file permissions on the target device when uploading
-        # from a Windows workstation (excluding Cygwin and WSL).
-        tasks.clear()
-        for mode, group in groupby(transfers, lambda tr: tr.mode):
-            if dest := next(group).dest:
-                tasks.append(
-                    wait_exec(
-                        which("ssh") or "ssh",
-                        cfg.deployment_ssh_host_name,
-                        f"find {_posijoin(host_dir, dest)} "
-                        f"-type f -execdir chmod {mode} '{{}}' ';'",
-                    )
-                )
-        await max_gather(2, *tasks)
-
-
-async def _rsync_rsh():
-    # argv[0]  = Path of this Python script
-    # argv[1]  = "--rsh"
-    # argv[2]  = application container name
-    # argv[3]  = target device hostname (given by the ‘rsync’ process)
-    # argv[4:] = rsync’s remote command, e.g. ['rsync', '--server',
-    #   '-abcdefghij.klmnopqrs', '--mkpath', '.', '/usr/src/app/']
-    _logger.debug("%s: sys.argv: %s", _rsync_rsh.__name__, sys.argv)
-    if len(sys.argv) < 5:
-        raise CommandLineError("--rsh option used but len(sys.argv) < 5")
-    container_name = quote(sys.argv[2])
-    hostname = sys.argv[3]
-    rsync_cmd = " ".join(quote(i) for i in sys.argv[4:])
-    remote_cmd = (
-        '"$(command -v docker || command -v podman || command -v balena-engine || echo docker)"'
-        f" exec -i {container_name} {rsync_cmd}"
-    )
-    await wait_exec(which("ssh") or "ssh", hostname, remote_cmd)
+        # from a Windows workstation (excluding Cygwin and WSL), with a
+        # single remote shell command line.
+        chmod_cmds = [
+            f"find {remote_dirs[dest]} -type f -exec chmod {mode} '{{}}' +"
+            for mode, group in groupby(transfers, lambda tr: tr.mode)
+            if (dest := next(group).dest)
+        ]
+        await wait_exec(
+            *_ssh_cmd(), cfg.deployment_ssh_host_name, " && ".join(chmod_cmds)
+        )
 
 
 async def _run_operation(opts: Opts):
     cfg = FlatConfig.from_config(Config(opts.config_file))
-
     if opts.container:
         _check_rsync()
+
+    control_dir = await _start_ssh_master(cfg)
+    try:
+        await _upload(opts, cfg)
+    finally:
+        await _stop_ssh_master(cfg, control_dir)
+
+
+async def _upload(opts: Opts, cfg: FlatConfig):
+    if opts.container:
         if await _is_container_running(cfg):
             _logger.info(
                 "rsync’ing to running container ‘%s’ on ‘%s’",
@@ -373,8 +477,8 @@ def _parse_cmd_line() -> Opts:
             configuration file. With the above config, ‘ssh pi4’ opens a shell
             on the host OS without password prompts and without the need of
             specifying a username and port number on the command line. This may
-            be relevant because this script uses the ‘rsync --rsh’ option to
-            upload files to a running Docker container, leveraging the ‘docker
+            be relevant because this script uses the ‘rsync --rsync-path’ option
+            to upload files to a running Docker container, leveraging the ‘docker
             exec’ command executed on the host OS. (The ‘rsync’ tool needs to be
             installed in the application container, but the container does not
             need to have an ‘ssh’ client or server installed.)
@@ -456,13 +560,6 @@ async def main():
     configure_logging(logger=_logger, subproc_log=_logger.info)
     exit_code = 0
     try:
-        # Skip argparse parsing for --rsh because rsync appends arbitrary
-        # arguments to the command line, e.g. ‘--server’, and argparse’s
-        # ‘parse_known_args()’ function may consume arguments mistakenly
-        # believed to be ‘known’.
-        if len(sys.argv) > 1 and sys.argv[1] == "--rsh":
-            return await _rsync_rsh()
-
         opts = _parse_cmd_line()
         await _run_operation(opts)
     except (Exception, asyncio.CancelledError, KeyboardInterrupt) as e: